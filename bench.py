@@ -0,0 +1,214 @@
+"""
+Render benchmarks with a local history and regression check.
+
+    python bench.py                          # every workload at every quality
+    python bench.py -w tex,updaters -q l,m   # a subset
+
+Workloads, one representative scene each:
+
+    tex                 numbers_to_signals.py LogsScene
+    updaters            park.py ParkTransformVisualization
+    small_animations    leetcode04.py MatrixRotation
+    images              code02.py ContainerWaterScene
+
+Every (workload, quality) pair renders in a fresh Python process, with the
+partial-movie cache disabled, and reports the wall time of the render, the
+frames of video produced per second of wall time, the peak RSS of the
+process (None where the platform does not report it) and the time spent
+in LaTeX (manim's compile_tex and convert_to_svg, tex_batch's batches and
+tex_format's format builds). With --cold_tex the LaTeX caches start empty.
+
+Results are appended to bench_history.json with the current commit, and
+compared with the previous entry of the same kind (warm or cold LaTeX): a
+wall time or peak RSS more than --threshold above it is reported as a
+regression. Regressions and failed workloads make the exit status non-zero.
+"""
+import argparse
+import functools
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from render_all import QUALITIES, load_module
+
+ROOT = Path(__file__).resolve().parent
+HISTORY_FILE = ROOT / "bench_history.json"
+WORKLOADS = {
+    "tex": ("numbers_to_signals.py", "LogsScene"),
+    "updaters": ("park.py", "ParkTransformVisualization"),
+    "small_animations": ("leetcode04.py", "MatrixRotation"),
+    "images": ("code02.py", "ContainerWaterScene"),
+}
+# Metrics where a higher value than the baseline is a regression
+WATCHED = ("wall", "peak_rss_mb")
+# Functions that run LaTeX or dvisvgm, however they start the process
+LATEX_ENTRY_POINTS = (
+    ("manim.utils.tex_file_writing", "compile_tex"),
+    ("manim.utils.tex_file_writing", "convert_to_svg"),
+    ("tex_batch", "compile_batch"),
+    ("tex_format", "build_format"),
+)
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB; None where it cannot be read."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def time_latex(latex):
+    """Have the LaTeX entry points add their time and calls to latex; nested calls count once."""
+    depth = [0]
+
+    def timed(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if depth[0]:
+                return function(*args, **kwargs)
+            depth[0] += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+                latex["seconds"] += time.perf_counter() - start
+                latex["runs"] += 1
+        return wrapper
+
+    for module_name, name in LATEX_ENTRY_POINTS:
+        module = importlib.import_module(module_name)
+        setattr(module, name, timed(getattr(module, name)))
+
+
+def run_workload(file_name, scene_name, quality, media_dir):
+    """Render one scene in this process and return its measurements."""
+    from manim import tempconfig
+
+    latex = {"seconds": 0.0, "runs": 0}
+    # Before the scene file imports tex_batch/tex_format, so their callers see the wrappers
+    time_latex(latex)
+    module = load_module(ROOT / file_name)
+    with tempconfig({"quality": QUALITIES[quality], "disable_caching": True, "media_dir": media_dir}):
+        from manim import config
+
+        scene = getattr(module, scene_name)()
+        start = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - start
+        frames = int(scene.renderer.time * config.frame_rate)
+    return {
+        "wall": wall,
+        "frames": frames,
+        "fps": frames / wall if wall else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "latex_seconds": latex["seconds"],
+        "latex_runs": latex["runs"],
+    }
+
+
+def measure(workload, quality, cold_tex=False):
+    """Run one workload at one quality in a fresh interpreter."""
+    file_name, scene_name = WORKLOADS[workload]
+    env = dict(os.environ)
+    media_dir = ROOT / "media" / "bench" / workload / quality
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if cold_tex:
+            env["MANIM_TEX_CACHE"] = str(Path(temp_dir) / "tex_cache")
+            media_dir = Path(temp_dir) / "media"
+        command = [sys.executable, __file__, "--run", file_name, scene_name, quality, str(media_dir)]
+        result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def git_commit():
+    result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def load_history():
+    return json.loads(HISTORY_FILE.read_text()) if HISTORY_FILE.exists() else []
+
+
+def regressions(results, baseline, threshold):
+    """(key, metric, old, new) for every watched metric more than threshold above the baseline."""
+    found = []
+    for key, result in results.items():
+        old = baseline.get(key)
+        if not old or "error" in old or "error" in result:
+            continue
+        for metric in WATCHED:
+            if old.get(metric) is None or result.get(metric) is None:
+                continue
+            if old[metric] > 0 and result[metric] > old[metric] * (1 + threshold):
+                found.append((key, metric, old[metric], result[metric]))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark representative scenes and track the results.")
+    parser.add_argument("-w", "--workloads", default=",".join(WORKLOADS), help="comma-separated workloads")
+    parser.add_argument("-q", "--qualities", default=",".join(QUALITIES), help="comma-separated presets (l,m,h,p,k)")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative increase counted as a regression")
+    parser.add_argument("--cold_tex", action="store_true", help="start with empty LaTeX caches")
+    parser.add_argument("--no_save", action="store_true", help="do not append the results to the history")
+    parser.add_argument("--run", nargs=4, metavar=("FILE", "SCENE", "QUALITY", "MEDIA_DIR"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_workload(*args.run)))
+        return
+
+    history = load_history()
+    # Warm and cold LaTeX runs are only compared with their own kind
+    baseline = next((entry["results"] for entry in reversed(history) if entry.get("cold_tex") == args.cold_tex), {})
+    results = {}
+    print(f"{'workload':<26} {'wall':>8} {'fps':>7} {'rss MB':>8} {'latex':>7}  vs baseline")
+    for workload in args.workloads.split(","):
+        for quality in args.qualities.split(","):
+            key = f"{workload}/{quality}"
+            result = results[key] = measure(workload, quality, args.cold_tex)
+            if "error" in result:
+                print(f"{key:<26} FAILED: {result['error']}")
+                continue
+            old = baseline.get(key)
+            change = f"{result['wall'] / old['wall'] - 1:+.1%}" if old and "error" not in old else "-"
+            rss = "-" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.0f}"
+            print(
+                f"{key:<26} {result['wall']:7.1f}s {result['fps']:7.1f} {rss:>8} "
+                f"{result['latex_seconds']:6.1f}s  {change}"
+            )
+
+    found = regressions(results, baseline, args.threshold)
+    for key, metric, old, new in found:
+        print(f"REGRESSION {key} {metric}: {old:.2f} -> {new:.2f}")
+    if not args.no_save:
+        history.append({
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "cold_tex": args.cold_tex,
+            "results": results,
+        })
+        HISTORY_FILE.write_text(json.dumps(history, indent=1))
+    failed = any("error" in result for result in results.values())
+    sys.exit(1 if found or failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Smoke test every scene without rendering it.
+
+    python check_scenes.py              # every scene file in this directory
+    python check_scenes.py park.py -j 4
+
+Each scene's construct() runs in a worker process with rasterization and
+encoding disabled (see dry_run.py), so every Tex string is still compiled
+and every layout call, index and animation is still evaluated - a broken
+LaTeX string or an out-of-range index fails here in seconds instead of
+halfway through a render. For each scene it reports the construct() time,
+the number of plays and the animation duration; the exit status is non-zero
+if any scene failed.
+
+Scenes are found by parsing the files (classes deriving from something named
+*Scene), so the parent process never imports manim.
+"""
+import argparse
+import ast
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+# Defines a Scene base class, not a scene to render
+HELPER_MODULES = {"fast_render"}
+
+
+def scene_files():
+    """The .py files of this directory that define scenes."""
+    return sorted(
+        path for path in ROOT.glob("*.py")
+        if path.stem not in HELPER_MODULES and find_scene_names(path)
+    )
+
+
+def base_name(node):
+    return node.attr if isinstance(node, ast.Attribute) else getattr(node, "id", "")
+
+
+def find_scene_names(file_name):
+    """Names of the classes in file_name with a base class named *Scene, in order."""
+    tree = ast.parse(Path(file_name).read_bytes(), filename=str(file_name))
+    return [
+        node.name for node in tree.body
+        if isinstance(node, ast.ClassDef) and any(base_name(base).endswith("Scene") for base in node.bases)
+    ]
+
+
+def check_scene(file_name, scene_name, media_dir):
+    """Dry-run one scene; returns a result dict (error is None on success)."""
+    from manim import tempconfig
+
+    from dry_run import dry_run
+    from render_all import load_module
+
+    result = {"file": Path(file_name).name, "scene": scene_name, "error": None,
+              "construct": 0.0, "plays": 0, "duration": 0.0}
+    start = time.perf_counter()
+    try:
+        # One media directory per scene, so workers never race on the Tex folder
+        with tempconfig({"media_dir": str(Path(media_dir) / Path(file_name).stem / scene_name)}):
+            scene = dry_run(getattr(load_module(file_name), scene_name))
+        result["plays"] = scene.renderer.num_plays
+        result["duration"] = scene.renderer.time
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["construct"] = time.perf_counter() - start
+    return result
+
+
+def check_scenes(files, jobs=None, media_dir="media/check_scenes"):
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [(file_name, scene) for file_name in files for scene in find_scene_names(file_name)]
+    print(f"Checking {len(tasks)} scenes from {len(files)} files with {jobs} workers")
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(check_scene, str(file_name), scene, media_dir) for file_name, scene in tasks]
+        results = []
+        for future in futures:
+            result = future.result()
+            label = f"{result['file']}:{result['scene']}"
+            if result["error"] is None:
+                status = f"{result['plays']:4d} plays  {result['duration']:7.1f}s of animation"
+            else:
+                status = "FAILED: " + result["error"].strip().splitlines()[-1]
+            print(f"  {label:<52} {result['construct']:6.1f}s  {status}")
+            results.append(result)
+
+    failed = [result for result in results if result["error"] is not None]
+    for result in failed:
+        print(f"\n{result['file']}:{result['scene']}\n{result['error']}")
+    total = sum(result["duration"] for result in results)
+    print(
+        f"{len(results) - len(failed)}/{len(results)} scenes passed in {time.perf_counter() - start:.1f}s, "
+        f"{total:.1f}s of animation in total"
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run every scene's construct() without rendering.")
+    parser.add_argument("files", nargs="*", help="scene files (default: all in this directory)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--media_dir", default="media/check_scenes")
+    args = parser.parse_args()
+    files = [Path(f).resolve() for f in args.files] or scene_files()
+    results = check_scenes(files, args.jobs, args.media_dir)
+    sys.exit(1 if any(result["error"] is not None for result in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,25 @@
 from manim import *
 
-class PalindromeVisualization(Scene):
+from fast_render import FastScene
+import tex_cache
+
+tex_cache.install()
+
+
+def char_row(text, squares, font_size=32):
+    """
+    Returns a VGroup with one letter per character of text, each centered
+    in the matching square. Every distinct character is typeset only once
+    and copied, so long strings cost one Tex per distinct glyph.
+    """
+    glyphs = {char: Tex(char, font_size=font_size) for char in dict.fromkeys(text)}
+    letters = VGroup(*[glyphs[char].copy() for char in text])
+    for square, letter in zip(squares, letters):
+        letter.move_to(square.get_center())
+    return letters
+
+
+class PalindromeVisualization(FastScene):
     def construct(self):
         ############################################
         # 1. Introduction & Algorithm Explanation
@@ -81,11 +100,7 @@ class PalindromeVisualization(Scene):
         ])
         squares1.arrange(RIGHT, buff=0.1)
         squares1.move_to(ORIGIN)
-        letters1 = VGroup(*[
-            Tex(letter, font_size=32) for letter in list(norm_str1)
-        ])
-        for square, letter in zip(squares1, letters1):
-            letter.move_to(square.get_center())
+        letters1 = char_row(norm_str1, squares1)
         self.play(FadeIn(squares1), FadeIn(letters1))
         self.wait(0.5)
 
@@ -169,11 +184,7 @@ class PalindromeVisualization(Scene):
         ])
         squares2.arrange(RIGHT, buff=0.1)
         squares2.move_to(ORIGIN)
-        letters2 = VGroup(*[
-            Tex(letter, font_size=32) for letter in list(norm_str2)
-        ])
-        for square, letter in zip(squares2, letters2):
-            letter.move_to(square.get_center())
+        letters2 = char_row(norm_str2, squares2)
         self.play(FadeIn(squares2), FadeIn(letters2))
         self.wait(0.5)
 
@@ -0,0 +1,160 @@
+"""
+Helpers for curves built from many Bezier segments (plots, parametric functions).
+
+VMobject.point_from_proportion measures the length of every segment of the
+path, in Python, each time it is called - MoveAlongPath calls it once per
+frame. ArcLengthTable measures the path once into a cumulative length table
+and answers each lookup with a binary search, giving the same points:
+
+    self.play(MoveAlongCurve(dot_a, phase_a), run_time=4, rate_func=linear)
+
+Switching waveforms are discontinuous, so sampling them with axes.plot
+needs a dense grid and still leaves slanted edges. pwm_curve finds where
+the reference crosses the carrier and draws the waveform as an exact
+polyline with one vertical edge per switching instant:
+
+    pwm = pwm_curve(axes, lambda x: np.sin(2*PI*x), lambda x: 0.5*np.sin(4*PI*x), color=GREEN)
+"""
+import math
+
+import numpy as np
+
+from manim import MoveAlongPath, VMobject
+
+# Same sampling manim uses to approximate the length of one segment
+SAMPLES_PER_CURVE = 10
+# Grid used to bracket reference/carrier crossings before refining them
+CROSSING_GRID = 2000
+EDGE_TOLERANCE = 1e-9
+# Pieces at the ends narrower than this fraction of the x range are dropped
+MIN_PIECE_WIDTH = 1e-6
+# Evenly spaced points compared to tell whether a path was edited in place
+PROBE_POINTS = 8
+
+
+def bernstein_matrix(ts, degree=3):
+    """Rows of Bernstein weights, one row per parameter value in ts."""
+    ts = np.asarray(ts, dtype=float)[:, None]
+    k = np.arange(degree + 1)
+    binomials = np.array([math.comb(degree, i) for i in k])
+    return binomials * ts**k * (1 - ts)**(degree - k)
+
+
+def probe_rows(points):
+    """Indices of the few points ArcLengthTable.matches compares."""
+    return np.linspace(0, len(points) - 1, min(PROBE_POINTS, len(points))).astype(int)
+
+
+class ArcLengthTable:
+    """Cumulative arc length of a VMobject's path, for fast proportion lookups.
+
+    matches() runs on every lookup, so it does not compare the whole path:
+    shift/scale/rotate either assign a new points array or move every point
+    in place, and both show up in the array's identity, its shape or a few
+    probe points. An in-place edit that leaves all probe points alone goes
+    unnoticed; call arc_length_table(vmobject, rebuild=True) after one.
+    """
+
+    def __init__(self, vmobject):
+        self.source = vmobject.points
+        self.points = np.array(vmobject.points)
+        self.probe = self.points[probe_rows(self.points)]
+        nppcc = vmobject.n_points_per_cubic_curve
+        self.curves = self.points[: len(self.points) // nppcc * nppcc].reshape(-1, nppcc, 3)
+        samples = bernstein_matrix(np.linspace(0, 1, SAMPLES_PER_CURVE), nppcc - 1)
+        sampled = np.einsum("sk,nkd->nsd", samples, self.curves)
+        lengths = np.linalg.norm(np.diff(sampled, axis=1), axis=2).sum(axis=1)
+        self.lengths = lengths
+        self.ends = np.cumsum(lengths)
+        self.total = self.ends[-1] if len(self.ends) else 0.0
+
+    def matches(self, vmobject):
+        points = vmobject.points
+        return (
+            points is self.source
+            and points.shape == self.points.shape
+            and np.array_equal(points[probe_rows(points)], self.probe)
+        )
+
+    def point_from_proportion(self, alpha):
+        if alpha < 0 or alpha > 1:
+            raise ValueError(f"Alpha {alpha} not between 0 and 1.")
+        if alpha == 1:
+            return self.points[-1]
+        target = alpha * self.total
+        # First segment whose end reaches the target, as manim's linear walk picks it
+        n = min(int(np.searchsorted(self.ends, target, side="left")), len(self.ends) - 1)
+        length = self.lengths[n]
+        residue = (target - (self.ends[n] - length)) / length if length != 0 else 0
+        return bernstein_matrix([residue], len(self.curves[n]) - 1)[0] @ self.curves[n]
+
+
+def arc_length_table(vmobject, rebuild=False):
+    """The vmobject's ArcLengthTable, built on first use and rebuilt if its points change."""
+    table = getattr(vmobject, "arc_length_table", None)
+    if rebuild or table is None or not table.matches(vmobject):
+        vmobject.throw_error_if_no_points()
+        table = ArcLengthTable(vmobject)
+        vmobject.arc_length_table = table
+    return table
+
+
+def point_from_proportion(vmobject, alpha):
+    return arc_length_table(vmobject).point_from_proportion(alpha)
+
+
+class MoveAlongCurve(MoveAlongPath):
+    """MoveAlongPath that looks positions up in the path's ArcLengthTable."""
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.move_to(point_from_proportion(self.path, self.rate_func(alpha)))
+
+
+def crossings(difference, x_min, x_max, grid=CROSSING_GRID, tolerance=EDGE_TOLERANCE / 10):
+    """x values in [x_min, x_max] where difference(x) > 0 changes truth value.
+
+    difference must accept arrays. Sign changes are bracketed on a grid and
+    then bisected, all brackets at once, down to tolerance.
+    """
+    xs = np.linspace(x_min, x_max, grid + 1)
+    above = difference(xs) > 0
+    edges = np.nonzero(above[1:] != above[:-1])[0]
+    lo, hi = xs[edges], xs[edges + 1]
+    lo_above = above[edges]
+    while len(lo) and np.max(hi - lo) > tolerance:
+        mid = (lo + hi) / 2
+        same = (difference(mid) > 0) == lo_above
+        lo = np.where(same, mid, lo)
+        hi = np.where(same, hi, mid)
+    edges = (lo + hi) / 2
+    # A sample landing exactly on a zero that difference only touches opens and
+    # closes a zero-width piece there; drop both of its edges
+    touching = np.diff(edges) < tolerance
+    keep = np.ones(len(edges), dtype=bool)
+    keep[:-1] &= ~touching
+    keep[1:] &= ~touching
+    return edges[keep]
+
+
+def pwm_levels(reference, carrier, x_min, x_max, high=1.0, low=0.0, **kwargs):
+    """Vertices (xs, ys) of the PWM waveform: high where reference > carrier, else low."""
+    difference = lambda x: reference(x) - carrier(x)
+    edges = crossings(difference, x_min, x_max, **kwargs)
+    # A switch right at either end would only add a piece far narrower than a pixel
+    margin = MIN_PIECE_WIDTH * (x_max - x_min)
+    edges = edges[(edges > x_min + margin) & (edges < x_max - margin)]
+    # Level of the first piece (judged at its middle), then it flips at every edge
+    first_end = edges[0] if len(edges) else x_max
+    first = difference(np.array([(x_min + first_end) / 2]))[0] > 0
+    states = (np.arange(len(edges) + 1) % 2 == 0) == first
+    levels = np.where(states, high, low)
+    xs = np.concatenate([[x_min], np.repeat(edges, 2), [x_max]])
+    ys = np.repeat(levels, 2)
+    return xs, ys
+
+
+def pwm_curve(axes, reference, carrier, x_range=None, high=1.0, low=0.0, **kwargs):
+    """The PWM waveform of reference against carrier as a polyline on axes."""
+    x_min, x_max = x_range[:2] if x_range is not None else axes.x_range[:2]
+    xs, ys = pwm_levels(reference, carrier, x_min, x_max, high, low)
+    return VMobject(**kwargs).set_points_as_corners(axes.c2p(xs, ys).T)
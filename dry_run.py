@@ -0,0 +1,53 @@
+"""
+Run a scene's construct() without rasterizing or encoding any frames.
+
+Every Tex/MathTex, layout call and animation is still built and finished, so
+the scene ends up in the same state as a real render - only the pixels and
+the video file are skipped.
+"""
+from manim import tempconfig
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.exceptions import EndSceneEarlyException
+
+
+class DryRenderer(CairoRenderer):
+    """CairoRenderer that never draws: plays are skipped, frames are never rasterized."""
+
+    def __init__(self, **kwargs):
+        super().__init__(skip_animations=True, **kwargs)
+        self.play_durations = []
+
+    def play(self, scene, *args, **kwargs):
+        start = self.time
+        super().play(scene, *args, **kwargs)
+        self.play_durations.append(self.time - start)
+
+    def update_frame(self, *args, **kwargs):
+        pass
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        return None
+
+    def render(self, scene, time, moving_mobjects):
+        pass
+
+    def scene_finished(self, scene):
+        pass
+
+
+def dry_run(scene_class, **scene_kwargs):
+    """Build scene_class and run its construct(); returns the finished scene.
+
+    renderer.num_plays and renderer.time hold the number of play/wait calls
+    and the total animation duration afterwards, renderer.play_durations the
+    duration of each call.
+    """
+    with tempconfig({"dry_run": True}):
+        scene = scene_class(renderer=DryRenderer(), **scene_kwargs)
+        scene.setup()
+        try:
+            scene.construct()
+        except EndSceneEarlyException:
+            pass
+        scene.tear_down()
+    return scene
@@ -0,0 +1,331 @@
+"""
+Incremental hashing for manim's partial-movie cache.
+
+Before every play, manim serializes the camera, the animations and every
+mobject on screen to JSON - arrays as text, functions as source code - and
+hashes the result. Scenes that play hundreds of short animations over the
+same mobjects (a matrix and its pseudocode in leetcode04.py) pay that for
+every play.
+
+Here each mobject keeps its digest from one play to the next (in an
+attribute that Mobject.copy() does not carry over):
+
+  * array attributes (points, rgbas, ...) are hashed as raw bytes, since
+    manim changes them in place,
+  * the digest of the other attributes is kept with references to every
+    object it was taken from - list items, dict entries, object attributes,
+    a function's code, defaults, closure cells and the globals it names,
+    all the way down - and reused as long as each of them is still the
+    same object, and the mobjects and arrays it reached still have the
+    digests they had,
+  * functions count by their code, defaults, closures and the values of
+    the module globals they name (helpers, constants), except modules and
+    manim's config, which the camera's digest already covers,
+  * a mobject's digest combines its arrays, its attributes' digest and its
+    submobjects' digests, and the play's hash combines the animations' and
+    mobjects'.
+
+So an unchanged mobject costs an identity walk over what it holds and a
+hash of its arrays, with no copies kept. Like manim's hash, it changes
+whenever anything the frames depend on changes; it is not the same string
+as manim's, so the first render after installing it misses the existing
+partial movies.
+
+Usage (at the top of a scene file):
+
+    import fast_hash
+    fast_hash.install()
+"""
+import functools
+import hashlib
+import operator
+import types
+
+import numpy as np
+
+from manim import Mobject, config, logger
+from manim.renderer import cairo_renderer
+from manim.utils.hashing import KEYS_TO_FILTER_OUT
+
+DIGEST_SIZE = 16
+# Attribute of each mobject holding its AttributeDigest
+DIGEST_ATTRIBUTE = "_fast_hash_digest"
+# Not part of what gets drawn: caches, back references, the submobjects (hashed as children)
+SKIPPED_KEYS = KEYS_TO_FILTER_OUT | {"submobjects", "arc_length_table", DIGEST_ATTRIBUTE}
+CAMERA_KEYS = (
+    "background_color", "background_opacity", "background_image", "pixel_width", "pixel_height",
+    "frame_width", "frame_height", "frame_center", "frame_rate", "n_channels",
+    "cairo_line_width_multiple", "use_z_index", "image_mode",
+)
+EMPTY_CELL = object()
+# Values that cannot change in place
+IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+# code object -> digest of its bytecode, constants and names
+_code_digests = {}
+# code object -> names it and the functions nested in it may look up as globals
+_global_names = {}
+_original_get_hash_from_play_call = cairo_renderer.get_hash_from_play_call
+
+
+def array_digest(array):
+    h = hashlib.blake2b(f"{array.dtype.str}{array.shape}".encode(), digest_size=DIGEST_SIZE)
+    if array.dtype.hasobject:
+        h.update(repr(array.tolist()).encode())
+    else:
+        h.update(np.ascontiguousarray(array).data)
+    return h.digest()
+
+
+def code_digest(code):
+    digest = _code_digests.get(code)
+    if digest is None:
+        h = hashlib.blake2b(code.co_code, digest_size=DIGEST_SIZE)
+        h.update(repr(code.co_names).encode())
+        for constant in code.co_consts:
+            h.update(code_digest(constant) if isinstance(constant, types.CodeType) else repr(constant).encode())
+        digest = _code_digests[code] = h.digest()
+    return digest
+
+
+def global_names(code):
+    names = _global_names.get(code)
+    if names is None:
+        names = set(code.co_names)
+        for constant in code.co_consts:
+            if isinstance(constant, types.CodeType):
+                names |= global_names(constant)
+        names = _global_names[code] = tuple(sorted(names))
+    return names
+
+
+def function_globals(function):
+    """(name, value) of the module globals function names, other than modules and manim's config."""
+    module_globals = function.__globals__
+    return [
+        (name, module_globals[name]) for name in global_names(function.__code__)
+        if name in module_globals
+        and not isinstance(module_globals[name], types.ModuleType) and module_globals[name] is not config
+    ]
+
+
+def cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return EMPTY_CELL
+
+
+def references(value):
+    """The objects value holds directly."""
+    if isinstance(value, IMMUTABLE_TYPES):
+        return ()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(value)
+    if isinstance(value, dict):
+        return tuple(item for pair in value.items() for item in pair)
+    if isinstance(value, types.FunctionType):
+        cells = tuple(cell_contents(cell) for cell in value.__closure__ or ())
+        names = tuple(item for pair in function_globals(value) for item in pair)
+        return (value.__code__, value.__defaults__, value.__kwdefaults__, *cells, *names)
+    if isinstance(value, types.MethodType):
+        return (value.__func__, value.__self__)
+    if isinstance(value, functools.partial):
+        return (value.func, value.args, value.keywords)
+    if isinstance(value, (Mobject, type, types.ModuleType)) or value is config:
+        return ()
+    if hasattr(value, "__dict__") and isinstance(value.__dict__, dict):
+        return references(value.__dict__)
+    return ()
+
+
+def hold(value, held, seen):
+    """Append value and everything it holds to held, down to mobjects and arrays (checked by digest)."""
+    held.append(value)
+    if isinstance(value, IMMUTABLE_TYPES) or isinstance(value, (np.ndarray, Mobject)) or id(value) in seen:
+        return
+    seen.add(id(value))
+    contents = references(value)
+    held.append(len(contents))
+    for item in contents:
+        hold(item, held, seen)
+
+
+class AttributeDigest:
+    """Digest of a mobject's non-array attributes, with what it was taken from."""
+
+    def __init__(self, held, reached, digest):
+        # Attribute names, values and what they hold, kept alive so their identities stay meaningful
+        self.held = held
+        # [(mobject or array, digest)] reached while hashing the attributes
+        self.reached = reached
+        self.digest = digest
+
+    def __deepcopy__(self, memo):
+        # Mobject.copy() gives the copy its own values; it starts without a digest
+        return None
+
+
+class PlayHasher:
+    """Digests of the objects of one play; shared objects and cycles are hashed once."""
+
+    def __init__(self, *opaque):
+        # Objects (the scene, manim's config) that only count by identity, as in manim's hash
+        self.memo = {id(obj): type(obj).__name__.encode() for obj in (config, *opaque)}
+        # (object, digest) of the mobjects and arrays reached by the attributes being hashed
+        self.reached = None
+
+    def update(self, h, obj):
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, np.generic)):
+            h.update(f"{type(obj).__name__}:{obj!r};".encode())
+            return
+        if isinstance(obj, bytes):
+            h.update(b"bytes:" + obj)
+            return
+        h.update(self.object_digest(obj))
+
+    def object_digest(self, obj):
+        if isinstance(obj, np.ndarray):
+            digest = array_digest(obj)
+        else:
+            key = id(obj)
+            digest = self.memo.get(key)
+            if digest is None:
+                self.memo[key] = b"cycle"
+                digest = self.memo[key] = self.digest(obj)
+        if self.reached is not None and isinstance(obj, (Mobject, np.ndarray)):
+            self.reached.append((obj, digest))
+        return digest
+
+    def digest(self, obj):
+        h = hashlib.blake2b(type(obj).__qualname__.encode(), digest_size=DIGEST_SIZE)
+        if isinstance(obj, Mobject):
+            self.update_mobject(h, obj)
+        elif isinstance(obj, (list, tuple)):
+            for item in obj:
+                self.update(h, item)
+        elif isinstance(obj, (set, frozenset)):
+            for digest in sorted(self.sequence_digests(obj)):
+                h.update(digest)
+        elif isinstance(obj, dict):
+            self.update_dict(h, obj)
+        elif isinstance(obj, types.MethodType):
+            self.update(h, obj.__func__)
+            self.update(h, obj.__self__)
+        elif isinstance(obj, types.FunctionType):
+            self.update_function(h, obj)
+        elif isinstance(obj, functools.partial):
+            self.update(h, obj.func)
+            self.update(h, obj.args)
+            self.update(h, obj.keywords)
+        elif isinstance(obj, (type, types.ModuleType, types.BuiltinFunctionType)):
+            h.update(f"{getattr(obj, '__module__', '')}.{obj.__qualname__ if isinstance(obj, type) else obj.__name__}".encode())
+        elif hasattr(obj, "__dict__") and isinstance(obj.__dict__, dict):
+            self.update_dict(h, obj.__dict__)
+        else:
+            text = repr(obj)
+            # Default reprs only say where the object lives
+            h.update((type(obj).__qualname__ if " at 0x" in text else text).encode())
+        return h.digest()
+
+    def sequence_digests(self, items):
+        digests = []
+        for item in items:
+            h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            self.update(h, item)
+            digests.append(h.digest())
+        return digests
+
+    def update_dict(self, h, dct):
+        for name, value in dct.items():
+            if name in SKIPPED_KEYS:
+                continue
+            self.update(h, name)
+            self.update(h, value)
+
+    def update_mobject(self, h, mob):
+        # Every non-array attribute with the objects it holds, compared by identity with the last play's
+        held = []
+        seen = set()
+        for name, value in mob.__dict__.items():
+            if name in SKIPPED_KEYS:
+                continue
+            if isinstance(value, np.ndarray):
+                h.update(name.encode())
+                h.update(array_digest(value))
+                continue
+            held.append(name)
+            hold(value, held, seen)
+        h.update(self.attributes_digest(mob, held))
+        for submobject in mob.submobjects:
+            self.update(h, submobject)
+
+    def attributes_digest(self, mob, held):
+        """Digest of mob's non-array attributes, reused from an earlier play while it is still valid."""
+        cached = mob.__dict__.get(DIGEST_ATTRIBUTE)
+        if cached is not None and self.still_valid(cached, held):
+            return cached.digest
+        outer, self.reached = self.reached, []
+        try:
+            h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+            for name, value in mob.__dict__.items():
+                if name not in SKIPPED_KEYS and not isinstance(value, np.ndarray):
+                    h.update(name.encode())
+                    self.update(h, value)
+            reached = self.reached
+        finally:
+            self.reached = outer
+        digest = h.digest()
+        mob.__dict__[DIGEST_ATTRIBUTE] = AttributeDigest(held, reached, digest)
+        return digest
+
+    def still_valid(self, cached, held):
+        if len(cached.held) != len(held) or not all(map(operator.is_, held, cached.held)):
+            return False
+        return all(self.object_digest(obj) == digest for obj, digest in cached.reached)
+
+    def update_function(self, h, function):
+        h.update(code_digest(function.__code__))
+        self.update(h, function.__defaults__)
+        self.update(h, function.__kwdefaults__)
+        for cell in function.__closure__ or ():
+            contents = cell_contents(cell)
+            if contents is EMPTY_CELL:
+                h.update(b"empty cell")
+            else:
+                self.update(h, contents)
+        for name, value in function_globals(function):
+            h.update(name.encode())
+            self.update(h, value)
+
+
+def camera_digest(camera):
+    h = hashlib.blake2b(type(camera).__qualname__.encode(), digest_size=DIGEST_SIZE)
+    hasher = PlayHasher()
+    for name in CAMERA_KEYS:
+        hasher.update(h, name)
+        hasher.update(h, getattr(camera, name, None))
+    return h.digest()
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    """Drop-in for manim's get_hash_from_play_call, built from cached digests."""
+    hasher = PlayHasher(scene_object)
+    parts = []
+    for objects in (sorted(animations_list, key=str), current_mobjects_list):
+        h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        for obj in objects:
+            hasher.update(h, obj)
+        parts.append(h.hexdigest())
+    hash_complete = "_".join([camera_digest(camera_object).hex(), *parts])
+    logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
+    return hash_complete
+
+
+def install():
+    """Hash every play of this process with get_hash_from_play_call above."""
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+
+
+def uninstall():
+    cairo_renderer.get_hash_from_play_call = _original_get_hash_from_play_call
@@ -0,0 +1,686 @@
+"""
+Drop-in Scene for the Cairo renderer that avoids redrawing what did not change.
+
+    from fast_render import FastScene
+
+    class ComplexNumbersScene(FastScene):
+        def construct(self):
+            ...
+
+Static layer caching
+    manim already draws the mobjects that are not part of a play() once per
+    play, into a static background image. FastRenderer keeps that image
+    across plays and only redraws it when one of those mobjects (or the
+    camera background) actually changed, so a NumberPlane that sits on
+    screen through thirty plays is rasterized once.
+
+    Within a play, the moving mobjects (animated ones, plus everything drawn
+    above a mobject with updaters) are fingerprinted every frame. The bottom
+    run of them that did not change since the previous frame is baked into a
+    second cached layer, and only the mobjects above it are drawn per frame.
+    Draw order is unchanged, so the frames are the same as manim's.
+
+Dirty regions
+    When only a few of the moving mobjects change from one frame to the
+    next (two squares of a 21-cell array changing colour), the previous
+    frame is kept: the rectangle covering the old and new bounding boxes of
+    the changed mobjects is restored from the layer below and redrawn with a
+    Cairo clip, so a frame costs as much as the area that changed. Frames
+    where the change covers most of the picture, or with a moving mobject
+    whose extent is not known (an ImageMobject), are drawn in full.
+
+Static holds
+    A wait() with nothing updating is a single frame repeated for its whole
+    duration. Instead of streaming every copy to ffmpeg, FastRenderer writes
+    the frame once and ffmpeg's tpad filter clones it for the rest of the
+    hold, so the hold costs one rasterization and one frame of pipe I/O.
+
+Frame buffers
+    A frame is never copied into a fresh array. The camera resets its pixel
+    buffer in place (manim converts the background into a new array first),
+    the cached layers live in buffers that are allocated once per scene and
+    overwritten when the layer changes, and the writer is handed the
+    camera's own buffer. A long render keeps a constant set of frame-sized
+    arrays however many frames it writes.
+
+Streaming output (opt-in)
+    Normally every play() is encoded to its own partial movie file and the
+    files are joined when the scene ends. With stream_output, one ffmpeg
+    process encodes the whole scene straight into the final movie: frames
+    are piped as they are rasterized, handed over as a view of the camera's
+    pixel buffer (no per-frame copy), and there is no partial-movie cache
+    and no concat pass. Every play is rendered, so this is for uncached
+    renders; scenes with sound or sections fall back to partial movies.
+    Turn it on per scene or with MANIM_STREAM_OUTPUT=1.
+
+Tiled rasterization (opt-in)
+    With tile_workers > 1 the scene uses TiledCamera, which splits each
+    frame into horizontal bands and draws them on a thread pool. Each
+    vmobject's path is built once, in Python, and every band replays it into
+    its own Cairo context over the shared frame buffer, clipped to its rows
+    and with the same transform, so the pixels are the same as a
+    single-threaded render. pycairo releases the GIL while Cairo fills and
+    strokes, so only that part runs in parallel: it pays off on large frames
+    of big filled shapes, and not on frames of many small paths. Measure a
+    scene with and without it before turning it on, per scene
+    (tile_workers = 4) or for every FastScene with the MANIM_TILE_WORKERS
+    environment variable.
+
+Idle updaters
+    FastScene records which ValueTrackers each updater reads and the values
+    it saw. On the next frame the updater is skipped if it read at least one
+    tracker and none of them changed, so tracker-bound mobjects (including
+    always_redraw ones) cost nothing during an unrelated FadeIn or Write.
+    Updaters taking dt, updaters that read no tracker, and updaters of
+    mobjects the current play animates (a become() updater on a mobject an
+    animation restyles) always run. An updater that reads a tracker is
+    otherwise assumed to depend only on trackers and on mobjects driven by
+    them.
+
+Set the class attributes of a FastScene subclass to turn features off.
+"""
+import hashlib
+import inspect
+import math
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows: the pipe keeps its default size
+    fcntl = None
+
+import cairo
+import numpy as np
+
+from manim import Camera, Scene, ValueTracker, VMobject, __version__, config, logger
+from manim.constants import RendererType
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_gif_format, is_png_format, is_webm_format, write_to_movie
+
+STYLE_ARRAYS = ("points", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "sheen_direction", "pixel_array")
+STYLE_VALUES = ("stroke_width", "background_stroke_width", "sheen_factor", "joint_type", "cap_style", "z_index")
+# Cairo line width per unit of stroke_width, in scene units (Camera.cairo_line_width_multiple)
+LINE_WIDTH_PER_STROKE = 0.01
+# Mitred corners can reach this many line widths past a path (Cairo's default miter limit / 2)
+MITER_REACH = 5
+# Extra pixels around a dirty rectangle for antialiasing
+ANTIALIAS_PIXELS = 2
+# Above this fraction of the frame a dirty rectangle is not worth clipping to
+MAX_DIRTY_FRACTION = 0.5
+# Pipe buffer asked for when streaming, so a frame write returns while ffmpeg is still reading
+STREAM_PIPE_SIZE = 1 << 20
+# Linux's fcntl command number, for Pythons that do not define it
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+
+def mobject_digest(mob):
+    """Digest of everything about mob itself (not its submobjects) that affects its pixels."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in STYLE_ARRAYS:
+        value = getattr(mob, name, None)
+        if isinstance(value, np.ndarray):
+            h.update(np.ascontiguousarray(value).data)
+    h.update(repr(tuple(getattr(mob, name, None) for name in STYLE_VALUES)).encode())
+    return h.digest()
+
+
+def common_prefix_length(a, b):
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+class FastFileWriter(SceneFileWriter):
+    """SceneFileWriter that can have ffmpeg repeat the last frame of a partial movie,
+    or stream the whole scene to a single ffmpeg process."""
+
+    def streaming(self):
+        if getattr(self, "stream_open", False):
+            return True
+        return (
+            getattr(self.renderer, "stream_output", False)
+            and write_to_movie() and not is_png_format() and not is_gif_format()
+            and not config.save_sections and not self.includes_sound
+        )
+
+    def hold_frames(self):
+        # Frames of the play about to be written that are one repeated frame
+        renderer = self.renderer
+        if not renderer.elide_static_holds or not write_to_movie() or is_png_format() or self.streaming():
+            return 0
+        scene = renderer.scene
+        if not scene.animations or not scene.is_current_animation_frozen_frame():
+            return 0
+        return int(scene.duration * config["frame_rate"])
+
+    def is_already_cached(self, hash_invocation):
+        if self.streaming():
+            return False
+        return super().is_already_cached(hash_invocation)
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self.held_frames = self.hold_frames() if allow_write else 0
+        if not self.streaming():
+            return super().begin_animation(allow_write, file_path)
+        # The first written play opens the pipe to the final movie, later ones keep writing to it
+        if allow_write and not getattr(self, "stream_open", False):
+            self.open_movie_pipe(self.movie_file_path)
+            self.stream_open = True
+
+    def end_animation(self, allow_write=False):
+        if not self.streaming():
+            super().end_animation(allow_write)
+
+    def write_frame(self, frame_or_renderer):
+        if config.renderer == RendererType.CAIRO and write_to_movie():
+            # A view of the frame, not a tobytes() copy; large writes bypass the pipe's Python buffer
+            self.writing_process.stdin.write(memoryview(np.ascontiguousarray(frame_or_renderer)).cast("B"))
+            return
+        super().write_frame(frame_or_renderer)
+
+    def finish(self):
+        if not self.streaming():
+            return super().finish()
+        if not getattr(self, "stream_open", False):
+            logger.info("No animations were written")
+            return
+        if self.includes_sound:
+            logger.warning("Sound added after streaming started is not in the movie")
+        self.writing_process.stdin.close()
+        self.writing_process.wait()
+        self.stream_open = False
+        self.print_file_ready_message(str(self.movie_file_path))
+        if self.subcaptions:
+            self.write_subcaption_file()
+
+    def open_movie_pipe(self, file_path=None):
+        if file_path is None:
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+        self.partial_movie_file_path = file_path
+
+        fps = config["frame_rate"]
+        if fps == int(fps):
+            fps = int(fps)
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-f", "rawvideo",
+            "-s", "%dx%d" % (config["pixel_width"], config["pixel_height"]),
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", "-",
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        ]
+        if self.held_frames > 1:
+            # Only the first frame of the hold is piped; ffmpeg clones it for the rest
+            command += ["-vf", f"tpad=stop_mode=clone:stop={self.held_frames - 1}"]
+        if is_webm_format():
+            command += ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+        elif config["transparent"]:
+            command += ["-vcodec", "qtrle"]
+        else:
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+        command += [str(file_path)]
+        self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        if self.streaming() and fcntl is not None:
+            try:
+                fcntl.fcntl(self.writing_process.stdin, F_SETPIPE_SZ, STREAM_PIPE_SIZE)
+            except OSError:
+                pass
+
+
+class FastRenderer(CairoRenderer):
+    def __init__(self, cache_layers=True, elide_static_holds=True, dirty_regions=True, stream_output=False, **kwargs):
+        kwargs.setdefault("file_writer_class", FastFileWriter)
+        super().__init__(**kwargs)
+        self.cache_layers = cache_layers
+        self.elide_static_holds = elide_static_holds
+        self.dirty_regions = dirty_regions
+        self.stream_output = stream_output
+        self.scene = None
+        # Static layer kept across plays
+        self.static_layer = None
+        self.static_layer_key = None
+        # Moving mobjects baked into a second layer during the current play
+        self.moving_layer = None
+        self.baked_states = []
+        self.previous_states = []
+        # Pixel boxes of the moving mobjects in the frame still held by the camera
+        self.previous_boxes = None
+        # Preallocated frame-sized buffers for the layers, by name
+        self.frame_buffers = {}
+
+    def init_scene(self, scene):
+        self.scene = scene
+        super().init_scene(scene)
+
+    def freeze_current_frame(self, duration):
+        held = getattr(self.file_writer, "held_frames", 0)
+        if held <= 1 or self.skip_animations:
+            self.add_frame(self.camera.pixel_array, num_frames=int(duration / (1 / self.camera.frame_rate)))
+            return
+        logger.debug(f"Holding one frame for {held} frames")
+        self.file_writer.write_frame(self.camera.pixel_array)
+        self.time += held / self.camera.frame_rate
+
+    def keep_frame(self, name):
+        """Copy of the current frame, in the buffer reused for every frame kept under name."""
+        frame = self.camera.pixel_array
+        buffer = self.frame_buffers.get(name)
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = self.frame_buffers[name] = np.empty_like(frame)
+        np.copyto(buffer, frame)
+        return buffer
+
+    def camera_key(self):
+        camera = self.camera
+        return repr((
+            str(camera.background_color), camera.background_opacity, id(camera.background),
+            camera.pixel_width, camera.pixel_height, camera.frame_width, camera.frame_height,
+            tuple(camera.frame_center),
+        )).encode()
+
+    def layer_key(self, mobjects):
+        h = hashlib.blake2b(self.camera_key(), digest_size=16)
+        for mob in self.camera.get_mobjects_to_display(mobjects):
+            h.update(id(mob).to_bytes(8, "little"))
+            h.update(mobject_digest(mob))
+        return h.digest()
+
+    def update_frame(self, *args, **kwargs):
+        # Whatever the camera held is drawn over
+        self.previous_boxes = None
+        return super().update_frame(*args, **kwargs)
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.moving_layer = None
+        self.baked_states = []
+        self.previous_states = []
+        self.previous_boxes = None
+        if not self.cache_layers:
+            return super().save_static_frame_data(scene, static_mobjects)
+
+        self.static_image = None
+        if not static_mobjects:
+            return None
+        key = self.layer_key(static_mobjects)
+        if key != self.static_layer_key:
+            self.update_frame(scene, mobjects=static_mobjects)
+            self.static_layer = self.keep_frame("static")
+            self.static_layer_key = key
+        self.static_image = self.static_layer
+        return self.static_image
+
+    def render(self, scene, time, moving_mobjects):
+        if not self.cache_layers or not moving_mobjects:
+            self.update_frame(scene, moving_mobjects)
+            # The writer is done with a frame before the next one is drawn, so it gets the camera's buffer
+            self.add_frame(self.camera.pixel_array)
+            return
+
+        mobjects = self.camera.get_mobjects_to_display(moving_mobjects)
+        states = [(id(mob), mobject_digest(mob)) for mob in mobjects]
+        previous_states = self.previous_states
+        previous_boxes = self.previous_boxes
+        baked = len(self.baked_states)
+        if states[:baked] != self.baked_states:
+            self.moving_layer = None
+            self.baked_states = []
+            baked = 0
+
+        # Bake the bottom run of mobjects that stood still since the last frame
+        stable = common_prefix_length(states, previous_states)
+        if stable > baked:
+            self.reset_to_static_layer()
+            self.camera.capture_mobjects(mobjects[:stable], include_submobjects=False)
+            self.moving_layer = self.keep_frame("moving")
+            self.baked_states = states[:stable]
+            baked = stable
+            previous_boxes = None
+        self.previous_states = states
+
+        boxes = [self.pixel_box(mob) for mob in mobjects] if self.dirty_regions else None
+        region = None
+        # A mobject without a box could be inside the region without being redrawn
+        if boxes is not None and previous_boxes is not None and None not in boxes[baked:]:
+            region = self.dirty_region(states, boxes, previous_states, previous_boxes)
+        if region is None:
+            self.reset_to_layer()
+            self.camera.capture_mobjects(mobjects[baked:], include_submobjects=False)
+        elif region[0] < region[2] and region[1] < region[3]:
+            redraw = [mob for mob, box in zip(mobjects[baked:], boxes[baked:]) if boxes_overlap(box, region)]
+            self.redraw_region(region, redraw)
+        self.previous_boxes = boxes
+        self.add_frame(self.camera.pixel_array)
+
+    def pixel_box(self, mob):
+        """(x0, y0, x1, y1) pixel rectangle that mob can paint into; None if unknown."""
+        if not isinstance(mob, VMobject):
+            return None
+        camera = self.camera
+        stroke = max(getattr(mob, "stroke_width", 0) or 0, getattr(mob, "background_stroke_width", 0) or 0)
+        pad = stroke * LINE_WIDTH_PER_STROKE * MITER_REACH
+        low = mob.points[:, :2].min(axis=0) - pad
+        high = mob.points[:, :2].max(axis=0) + pad
+        scale_x = camera.pixel_width / camera.frame_width
+        scale_y = camera.pixel_height / camera.frame_height
+        left = camera.frame_center[0] - camera.frame_width / 2
+        top = camera.frame_center[1] + camera.frame_height / 2
+        width, height = camera.pixel_width, camera.pixel_height
+        return (
+            min(max(math.floor((low[0] - left) * scale_x) - ANTIALIAS_PIXELS, 0), width),
+            min(max(math.floor((top - high[1]) * scale_y) - ANTIALIAS_PIXELS, 0), height),
+            max(min(math.ceil((high[0] - left) * scale_x) + ANTIALIAS_PIXELS, width), 0),
+            max(min(math.ceil((top - low[1]) * scale_y) + ANTIALIAS_PIXELS, height), 0),
+        )
+
+    def dirty_region(self, states, boxes, previous_states, previous_boxes):
+        """Pixel rectangle covering every change since the previous frame.
+
+        None when the frame has to be drawn in full; an empty rectangle when
+        nothing changed.
+        """
+        if [key for key, _ in states] != [key for key, _ in previous_states]:
+            return None
+        region = (self.camera.pixel_width, self.camera.pixel_height, 0, 0)
+        for state, box, previous_state, previous_box in zip(states, boxes, previous_states, previous_boxes):
+            if state == previous_state:
+                continue
+            if box is None or previous_box is None:
+                return None
+            region = union_box(union_box(region, box), previous_box)
+        area = max(region[2] - region[0], 0) * max(region[3] - region[1], 0)
+        if area > MAX_DIRTY_FRACTION * self.camera.pixel_width * self.camera.pixel_height:
+            return None
+        return region
+
+    def redraw_region(self, region, mobjects):
+        """Restore region from the layer below and draw mobjects into it, clipped."""
+        x0, y0, x1, y1 = region
+        pixel_array = self.camera.pixel_array
+        pixel_array[y0:y1, x0:x1] = self.layer_below()[y0:y1, x0:x1]
+        ctx = self.camera.get_cairo_context(pixel_array)
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        if isinstance(self.camera, TiledCamera):
+            self.camera.clip_box = region
+        try:
+            self.camera.capture_mobjects(mobjects, include_submobjects=False)
+        finally:
+            ctx.restore()
+            if isinstance(self.camera, TiledCamera):
+                self.camera.clip_box = None
+
+    def layer_below(self):
+        if self.moving_layer is not None:
+            return self.moving_layer
+        if self.static_image is not None:
+            return self.static_image
+        return self.camera.background
+
+    def reset_to_layer(self):
+        self.camera.set_frame_to_background(self.layer_below())
+
+    def reset_to_static_layer(self):
+        if self.static_image is not None:
+            self.camera.set_frame_to_background(self.static_image)
+        else:
+            self.camera.reset()
+
+
+class InPlaceCamera(Camera):
+    """Camera that copies new frame contents straight into its pixel buffer."""
+
+    def set_pixel_array(self, pixel_array, convert_from_floats=False):
+        current = getattr(self, "pixel_array", None)
+        if (
+            convert_from_floats or current is None or not isinstance(pixel_array, np.ndarray)
+            or pixel_array.shape != current.shape or pixel_array.dtype != current.dtype
+        ):
+            return super().set_pixel_array(pixel_array, convert_from_floats)
+        np.copyto(current, pixel_array)
+
+
+class TiledCamera(InPlaceCamera):
+    """Camera that rasterizes vector mobjects in horizontal bands on a thread pool."""
+
+    tile_workers = os.cpu_count() or 1
+    # Pixel rectangle (x0, y0, x1, y1) to restrict drawing to, None for the whole frame
+    clip_box = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.executor = None
+        # (pixel_array, tile_workers, bands): holding the array itself means
+        # a new array with a recycled id can never be handed stale contexts
+        self.band_contexts = None
+        # Context the paths are built in before being replayed into the bands
+        self.path_context = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+
+    def get_band_contexts(self, pixel_array):
+        """One (context, band rectangle) per worker, all drawing into pixel_array."""
+        held = self.band_contexts
+        if held is None or held[0] is not pixel_array or held[1] != self.tile_workers:
+            matrix = self.get_cairo_context(pixel_array).get_matrix()
+            rows = np.linspace(0, self.pixel_height, self.tile_workers + 1).astype(int)
+            bands = []
+            for y0, y1 in zip(rows[:-1], rows[1:]):
+                surface = cairo.ImageSurface.create_for_data(pixel_array, cairo.FORMAT_ARGB32, self.pixel_width, self.pixel_height)
+                ctx = cairo.Context(surface)
+                ctx.set_matrix(matrix)
+                bands.append((ctx, (0, y0, self.pixel_width, y1)))
+            self.band_contexts = held = (pixel_array, self.tile_workers, bands)
+        return held[2]
+
+    def display_multiple_non_background_colored_vmobjects(self, vmobjects, pixel_array):
+        vmobjects = list(vmobjects)
+        if self.tile_workers < 2 or not vmobjects:
+            return super().display_multiple_non_background_colored_vmobjects(vmobjects, pixel_array)
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.tile_workers)
+        bands = self.get_band_contexts(pixel_array)
+        paths = self.build_paths(vmobjects, bands[0][0].get_matrix())
+        clip = self.clip_box or (0, 0, self.pixel_width, self.pixel_height)
+        # apply_stroke only sets the line join/cap of vmobjects that ask for one,
+        # the others stroke with whatever the context was left with
+        base = self.get_cairo_context(pixel_array)
+        line_style = (base.get_line_join(), base.get_line_cap())
+        futures = [
+            self.executor.submit(self.draw_band, ctx, intersect_box(band, clip), vmobjects, paths, line_style)
+            for ctx, band in bands
+        ]
+        # Leave the base context as drawing there would have, for the next frame
+        for final_style in [future.result() for future in futures]:
+            if final_style is not None:
+                base.set_line_join(final_style[0])
+                base.set_line_cap(final_style[1])
+
+    def build_paths(self, vmobjects, matrix):
+        """Each vmobject's Cairo path, or None where manim would keep the previous one."""
+        ctx = self.path_context
+        ctx.set_matrix(matrix)
+        paths = []
+        for vmobject in vmobjects:
+            ctx.new_path()
+            # Returns None without touching the path for a vmobject with no points
+            built = self.set_cairo_context_path(ctx, vmobject)
+            paths.append(ctx.copy_path() if built is not None else None)
+        return paths
+
+    def draw_band(self, ctx, box, vmobjects, paths, line_style):
+        """Draw into ctx within box; returns the line join and cap it ended with."""
+        x0, y0, x1, y1 = box
+        if x0 >= x1 or y0 >= y1:
+            return None
+        ctx.save()
+        matrix = ctx.get_matrix()
+        ctx.identity_matrix()
+        ctx.rectangle(x0, y0, x1 - x0, y1 - y0)
+        ctx.clip()
+        ctx.set_matrix(matrix)
+        ctx.set_line_join(line_style[0])
+        ctx.set_line_cap(line_style[1])
+        try:
+            # display_vectorized, with the path replayed instead of rebuilt
+            for vmobject, path in zip(vmobjects, paths):
+                if path is not None:
+                    ctx.new_path()
+                    ctx.append_path(path)
+                self.apply_stroke(ctx, vmobject, background=True)
+                self.apply_fill(ctx, vmobject)
+                self.apply_stroke(ctx, vmobject)
+            return ctx.get_line_join(), ctx.get_line_cap()
+        finally:
+            ctx.restore()
+
+
+def intersect_box(a, b):
+    return (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+
+
+def union_box(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def boxes_overlap(a, b):
+    return a is not None and a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+# Tracker reads of the updater currently running, None when not recording
+_tracker_reads = None
+_original_get_value = ValueTracker.get_value
+
+
+def _recording_get_value(self):
+    value = _original_get_value(self)
+    if _tracker_reads is not None:
+        _tracker_reads.append((self, value))
+    return value
+
+
+def record_tracker_reads():
+    """Have ValueTracker.get_value report reads to the updater scheduler."""
+    ValueTracker.get_value = _recording_get_value
+
+
+class FastScene(Scene):
+    cache_layers = True
+    elide_static_holds = True
+    dirty_regions = True
+    skip_idle_updaters = True
+    stream_output = os.environ.get("MANIM_STREAM_OUTPUT", "0") not in ("", "0")
+    tile_workers = int(os.environ.get("MANIM_TILE_WORKERS", 0))
+
+    def __init__(self, renderer=None, camera_class=Camera, skip_animations=False, **kwargs):
+        if camera_class is Camera:
+            camera_class = TiledCamera if self.tile_workers > 1 else InPlaceCamera
+        if renderer is None and config.renderer == RendererType.CAIRO:
+            renderer = FastRenderer(
+                camera_class=camera_class,
+                skip_animations=skip_animations,
+                cache_layers=self.cache_layers,
+                elide_static_holds=self.elide_static_holds,
+                dirty_regions=self.dirty_regions,
+                stream_output=self.stream_output,
+            )
+        super().__init__(renderer=renderer, camera_class=camera_class, skip_animations=skip_animations, **kwargs)
+        if isinstance(self.renderer.camera, TiledCamera):
+            self.renderer.camera.tile_workers = self.tile_workers
+        # (id(mobject), id(updater)) -> (mobject, updater, tracker reads of its last run)
+        self.updater_inputs = {}
+        self.updater_takes_dt = {}
+        # ids of the mobjects (with their families) that the current play animates
+        self.animated_ids = set()
+        if self.skip_idle_updaters:
+            record_tracker_reads()
+
+    def begin_animations(self):
+        self.animated_ids = {
+            id(mob) for animation in self.animations if animation.mobject is not None
+            for mob in animation.mobject.get_family()
+        }
+        self.forget_updater_inputs(self.animated_ids)
+        super().begin_animations()
+
+    def play_internal(self, skip_rendering=False):
+        try:
+            super().play_internal(skip_rendering)
+        finally:
+            # The animations left their mobjects in a state no recorded run has seen
+            self.forget_updater_inputs(self.animated_ids)
+            self.animated_ids = set()
+
+    def play(self, *args, **kwargs):
+        try:
+            super().play(*args, **kwargs)
+        finally:
+            # Also after frozen-frame waits, which never reach play_internal
+            self.prune_updater_inputs()
+
+    def forget_updater_inputs(self, mobject_ids):
+        for key in [key for key in self.updater_inputs if key[0] in mobject_ids]:
+            del self.updater_inputs[key]
+
+    def prune_updater_inputs(self):
+        """Drop the records of mobjects no longer in the scene and of removed updaters."""
+        attached = {}
+        for mobject in self.get_mobject_family_members():
+            for updater in mobject.updaters:
+                attached[id(mobject), id(updater)] = updater
+        self.updater_inputs = {
+            key: entry for key, entry in self.updater_inputs.items() if attached.get(key) is entry[1]
+        }
+        updaters = set(attached.values())
+        self.updater_takes_dt = {
+            updater: takes_dt for updater, takes_dt in self.updater_takes_dt.items() if updater in updaters
+        }
+
+    def update_mobjects(self, dt):
+        if not self.skip_idle_updaters:
+            return super().update_mobjects(dt)
+        for mobject in self.mobjects:
+            self.update_family(mobject, dt)
+
+    def update_family(self, mobject, dt):
+        # Same order as Mobject.update: own updaters, then submobjects
+        if mobject.updating_suspended:
+            return
+        for updater in mobject.updaters:
+            self.run_updater(mobject, updater, dt)
+        for submobject in mobject.submobjects:
+            self.update_family(submobject, dt)
+
+    def run_updater(self, mobject, updater, dt):
+        global _tracker_reads
+        takes_dt = self.updater_takes_dt.get(updater)
+        if takes_dt is None:
+            takes_dt = self.updater_takes_dt[updater] = "dt" in inspect.signature(updater).parameters
+        if takes_dt:
+            updater(mobject, dt)
+            return
+
+        key = (id(mobject), id(updater))
+        entry = None if key[0] in self.animated_ids else self.updater_inputs.get(key)
+        if entry is not None and entry[2] and all(_original_get_value(tracker) == value for tracker, value in entry[2]):
+            return
+
+        outer, _tracker_reads = _tracker_reads, []
+        try:
+            updater(mobject)
+        finally:
+            reads, _tracker_reads = _tracker_reads, outer
+        if outer is not None:
+            outer.extend(reads)
+        self.updater_inputs[key] = (mobject, updater, reads)
@@ -1,5 +1,9 @@
 from manim import *
 
+import tex_format
+
+tex_format.install()
+
 class ElectronDiffusionCurrent(Scene):
     def construct(self):
         self.camera.background_color = BLACK
@@ -0,0 +1,204 @@
+"""
+Golden-frame regression check for the renderers.
+
+    python golden_frames.py record park.py                 # store reference frames
+    python golden_frames.py check park.py                  # compare against them
+    python golden_frames.py check numbers_to_signals.py LogsScene --disable cache_layers,dirty_regions
+
+record draws a few keyframes of each scene at a low resolution and stores
+them under golden/<file>/<Scene>/ as small PNGs plus a manifest.json with
+their perceptual hashes. check draws the same frames again and compares:
+a frame passes if its hash is within --hash_tolerance bits of the reference
+and its mean absolute pixel difference within --pixel_tolerance. Failing
+frames are saved next to the reference as *_actual.png.
+
+Frames are reached by seeking, not by rendering the scene: construct() runs
+with every play skipped (as in dry_run.py) and only the plays that contain a
+keyframe time draw anything - the animations are advanced through the last
+few frames before that time and each is drawn with the scene's own
+renderer, so FastScene's baked moving layer, dirty regions and TiledCamera
+bands are what gets checked, not just a first frame drawn from scratch. --disable turns FastScene
+features off (cache_layers, dirty_regions, skip_idle_updaters) for one side
+of the comparison.
+
+The keyframes are --count times spread over the scene (from a dry run), or
+the --times given.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from manim import tempconfig
+
+from dry_run import dry_run
+from render_all import find_scenes, load_module
+
+GOLDEN_DIR = Path("golden")
+DEFAULT_SIZE = (320, 180)
+# Side of the image whose DCT the perceptual hash is taken from, and of the kept low frequencies
+HASH_IMAGE_SIZE = 32
+HASH_SIZE = 8
+# Frames drawn before each keyframe: the first is drawn in full, the second bakes
+# what stood still, and from the third on only the dirty region is redrawn
+LEAD_FRAMES = 3
+
+
+def dct_matrix(n):
+    k = np.arange(n)
+    return np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n))
+
+
+DCT = dct_matrix(HASH_IMAGE_SIZE)
+
+
+def perceptual_hash(frame):
+    """64-bit pHash of an RGB(A) frame, as a hex string."""
+    gray = Image.fromarray(np.asarray(frame)[..., :3]).convert("L").resize(
+        (HASH_IMAGE_SIZE, HASH_IMAGE_SIZE), Image.LANCZOS,
+    )
+    coefficients = (DCT @ np.asarray(gray, dtype=float) @ DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    # The DC term only says how bright the frame is
+    bits = coefficients > np.median(coefficients[1:])
+    return f"{int(''.join('1' if bit else '0' for bit in bits), 2):0{HASH_SIZE * HASH_SIZE // 4}x}"
+
+
+def hash_distance(a, b):
+    return bin(int(a, 16) ^ int(b, 16)).count("1")
+
+
+class FrameSeeker:
+    """Mixin for a skipping renderer that draws the frames at self.targets (seconds) only."""
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        # Skipped plays have already advanced self.time past themselves
+        start, end = self.time - scene.duration, self.time
+        due = [t for t in self.targets if t < end]
+        if not due:
+            self.static_image = None
+            return None
+        static_image = super().save_static_frame_data(scene, static_mobjects)
+        frozen = scene.is_current_animation_frozen_frame()
+        frame_time = 1 / self.camera.frame_rate
+        drawn = -1.0
+        for t in due:
+            if frozen:
+                self.update_frame(scene, mobjects=scene.moving_mobjects)
+            else:
+                local = max(t - start, 0)
+                lead = [local - i * frame_time for i in range(LEAD_FRAMES, 0, -1)]
+                for frame_t in [lead_t for lead_t in lead if lead_t >= 0 and lead_t > drawn] + [local]:
+                    scene.update_to_time(frame_t)
+                    self.render(scene, start + frame_t, scene.moving_mobjects)
+                drawn = local
+            self.frames[t] = np.array(self.camera.pixel_array)
+            self.targets.remove(t)
+        return static_image
+
+    def scene_finished(self, scene):
+        # Times at or past the end show the final frame
+        if self.targets:
+            self.static_image = None
+            self.update_frame(scene)
+            for t in self.targets:
+                self.frames[t] = np.array(self.camera.pixel_array)
+            self.targets = []
+        super().scene_finished(scene)
+
+
+def seek_frames(scene_class, times, size=DEFAULT_SIZE, disable=()):
+    """{time: RGBA frame} of scene_class at each of times, drawn without rendering the rest."""
+    overrides = {name: False for name in disable}
+    scene_class = type(scene_class.__name__, (scene_class,), overrides) if overrides else scene_class
+    with tempconfig({"dry_run": True, "pixel_width": size[0], "pixel_height": size[1]}):
+        scene = scene_class(skip_animations=True)
+        renderer = scene.renderer
+        renderer.__class__ = type(f"Seeking{type(renderer).__name__}", (FrameSeeker, type(renderer)), {})
+        renderer.targets = sorted(set(times))
+        renderer.frames = {}
+        scene.render()
+    return renderer.frames
+
+
+def keyframe_times(scene_class, count):
+    """count times spread over the scene, avoiding its first and last instant."""
+    duration = dry_run(scene_class).renderer.time
+    return [round(duration * (i + 0.5) / count, 3) for i in range(count)]
+
+
+def frame_name(t):
+    return f"t{t:08.3f}"
+
+
+def record(scene_class, directory, times, size, disable=()):
+    directory.mkdir(parents=True, exist_ok=True)
+    frames = seek_frames(scene_class, times, size, disable)
+    manifest = {"size": list(size), "frames": {}}
+    for t, frame in sorted(frames.items()):
+        name = frame_name(t)
+        Image.fromarray(frame).save(directory / f"{name}.png")
+        manifest["frames"][name] = {"time": t, "hash": perceptual_hash(frame)}
+    (directory / "manifest.json").write_text(json.dumps(manifest, indent=1))
+    print(f"  {scene_class.__name__:<32} recorded {len(frames)} frames in {directory}")
+    return True
+
+
+def check(scene_class, directory, disable=(), hash_tolerance=4, pixel_tolerance=2.0):
+    manifest_file = directory / "manifest.json"
+    if not manifest_file.exists():
+        print(f"  {scene_class.__name__:<32} no golden frames in {directory}")
+        return False
+    manifest = json.loads(manifest_file.read_text())
+    entries = manifest["frames"]
+    frames = seek_frames(scene_class, [entry["time"] for entry in entries.values()], tuple(manifest["size"]), disable)
+    passed = True
+    for name, entry in entries.items():
+        frame = frames[entry["time"]]
+        reference = np.asarray(Image.open(directory / f"{name}.png"))
+        distance = hash_distance(perceptual_hash(frame), entry["hash"])
+        difference = np.abs(frame.astype(np.int16) - reference.astype(np.int16)).mean()
+        ok = distance <= hash_tolerance and difference <= pixel_tolerance
+        if not ok:
+            Image.fromarray(frame).save(directory / f"{name}_actual.png")
+            passed = False
+        print(
+            f"  {scene_class.__name__:<32} {entry['time']:8.3f}s  hash distance {distance:2d}  "
+            f"pixel difference {difference:6.2f}  {'ok' if ok else 'CHANGED'}"
+        )
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or check golden keyframes of scenes.")
+    parser.add_argument("command", choices=("record", "check"))
+    parser.add_argument("file", help="scene file, e.g. park.py")
+    parser.add_argument("scenes", nargs="*", help="scenes (default: all in the file)")
+    parser.add_argument("--times", default=None, help="comma-separated keyframe times in seconds (record)")
+    parser.add_argument("--count", type=int, default=6, help="keyframes per scene when --times is not given")
+    parser.add_argument("--size", default="x".join(map(str, DEFAULT_SIZE)), help="frame size WxH (record)")
+    parser.add_argument("--disable", default="", help="comma-separated FastScene features to turn off")
+    parser.add_argument("--hash_tolerance", type=int, default=4, help="allowed differing hash bits")
+    parser.add_argument("--pixel_tolerance", type=float, default=2.0, help="allowed mean absolute difference (0-255)")
+    parser.add_argument("--golden_dir", default=str(GOLDEN_DIR))
+    args = parser.parse_args()
+
+    module = load_module(args.file)
+    disable = [name for name in args.disable.split(",") if name]
+    size = tuple(int(n) for n in args.size.split("x"))
+    passed = True
+    for scene_name in args.scenes or find_scenes(args.file):
+        scene_class = getattr(module, scene_name)
+        directory = Path(args.golden_dir) / Path(args.file).stem / scene_name
+        if args.command == "record":
+            times = [float(t) for t in args.times.split(",")] if args.times else keyframe_times(scene_class, args.count)
+            passed &= record(scene_class, directory, times, size, disable)
+        else:
+            passed &= check(scene_class, directory, disable, args.hash_tolerance, args.pixel_tolerance)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 from manim import *
 import numpy as np
 
+from curves import pwm_curve
+import spwm
+
 class EVInverterVisualization(Scene):
     def construct(self):
         self.setup_scene()
@@ -102,15 +105,20 @@ class EVInverterVisualization(Scene):
         self.remove(dc_arrows)
 
     def show_inverter_operation(self):
-        # Highlight switching components
+        # Drive the six switches from one simulated SPWM period, slowed down to run_time:
+        # each switch glows with its duty cycle during the frame
         switches = self.inverter[2]
-        self.play(
-            LaggedStart(*[
-                Indicate(switch[0], color=GREEN, scale_factor=1.3)
-                for switch in switches
-            ], lag_ratio=0.2),
-            run_time=3
-        )
+        run_time = 3
+        timeline = spwm.simulate(carrier_frequency=10e3, fundamental_frequency=50, modulation_index=0.8, v_dc=400)
+        duty = timeline.decimate(timeline.gates, int(run_time * config.frame_rate))
+        frame = ValueTracker(0)
+        opacities = [switch[0].get_fill_opacity() for switch in switches]
+        for switch, gate_duty in zip(switches, duty):
+            switch[0].add_updater(lambda m, d=gate_duty: m.set_fill(opacity=0.3 + 0.7 * d[int(frame.get_value())]))
+        self.play(frame.animate.set_value(len(duty[0]) - 1), run_time=run_time, rate_func=linear)
+        for switch, opacity in zip(switches, opacities):
+            switch[0].clear_updaters()
+            switch[0].set_fill(opacity=opacity)
 
         # Create PWM animation
         pwm = self.create_pwm_animation()
@@ -124,8 +132,9 @@ class EVInverterVisualization(Scene):
             axes = Axes(x_range=[0, 4], y_range=[0, 1.5], 
                        x_length=3, y_length=1.5,
                        axis_config={"color": GREEN_A}).shift(DOWN*2 + RIGHT*i*1.5)
-            graph = axes.plot(lambda x: (np.sin(x*PI*2) > 0.5*np.sin(x*PI*4)).astype(float),
-                            color=GREEN, use_smoothing=False)
+            # Exact edges where the reference crosses the carrier, no sampling
+            graph = pwm_curve(axes, lambda x: np.sin(x*PI*2), lambda x: 0.5*np.sin(x*PI*4),
+                            color=GREEN)
             pwm_group.add(VGroup(axes, graph))
         
         return pwm_group
@@ -140,7 +149,7 @@ class EVInverterVisualization(Scene):
                 x_length=3, y_length=1.5,
                 axis_config={"color": color}
             ).shift(UP*1.5 + RIGHT*i*1.5)
-            graph = axes.plot(lambda x: np.sin(x*PI*2 + i*PI*2/3), color=color)
+            graph = axes.plot(lambda x: np.sin(x*PI*2 + i*PI*2/3), color=color, use_vectorized=True)
             phases.add(VGroup(axes, graph))
         
         # Animate AC generation
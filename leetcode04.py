@@ -1,5 +1,12 @@
 from manim import *
-class MatrixRotation(Scene):
+
+import fast_hash
+from fast_render import FastScene
+
+# Hash the hundreds of plays of the swap loop from cached per-mobject digests
+fast_hash.install()
+
+class MatrixRotation(FastScene):
     def construct(self):
         # Title and introduction
         title = Text("Matrix Rotation (90° Clockwise)", font_size=48)
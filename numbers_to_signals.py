@@ -1,6 +1,21 @@
 from manim import *
 import numpy as np
 
+from fast_render import FastScene
+import scene_cache
+import tex_batch
+import tex_cache
+import tex_format
+
+# Reuse typeset glyphs (e.g. the bullet) across scenes, processes and runs
+tex_cache.install()
+# Typeset each scene's strings in one LaTeX run before it renders
+tex_batch.install()
+# Load the amsmath/amssymb preamble from a precompiled format
+tex_format.install()
+# Reuse the video of every scene whose code did not change
+scene_cache.install()
+
 ##############################################
 # GLOBAL SETTINGS & HELPER FUNCTIONS
 ##############################################
@@ -26,7 +41,7 @@ def bullet_item(text, font_size=28, color=TEXT_COLOR, bullet_color=BULLET_COLOR)
 ##############################################
 # SCENE 1: Introduction (~2 - 3 minutes)
 ##############################################
-class IntroScene(Scene):
+class IntroScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -95,7 +110,7 @@ class IntroScene(Scene):
 ##############################################
 # SCENE 2: Complex Numbers (~4 - 5 minutes)
 ##############################################
-class ComplexNumbersScene(Scene):
+class ComplexNumbersScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -229,7 +244,7 @@ class ComplexNumbersScene(Scene):
 ##############################################
 # SCENE 3: Exponents (~4 - 5 minutes)
 ##############################################
-class ExponentsScene(Scene):
+class ExponentsScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -262,7 +277,7 @@ class ExponentsScene(Scene):
         self.play(Create(axes), run_time=3)
         self.wait(1)
 
-        func_graph = axes.plot(lambda x: np.e**x, x_range=[-1, 3], color=HIGHLIGHT_COLOR)
+        func_graph = axes.plot(lambda x: np.e**x, x_range=[-1, 3], color=HIGHLIGHT_COLOR, use_vectorized=True)
         self.play(Create(func_graph), run_time=4)
 
         self.play(Write(graph_label), run_time=2)
@@ -318,7 +333,7 @@ class ExponentsScene(Scene):
 ##############################################
 # SCENE 4: Logarithms (~4 - 5 minutes)
 ##############################################
-class LogsScene(Scene):
+class LogsScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -395,7 +410,7 @@ class LogsScene(Scene):
 ##############################################
 # SCENE 5: Euler's Formula (~4 - 5 minutes)
 ##############################################
-class EulerScene(Scene):
+class EulerScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -481,7 +496,7 @@ class EulerScene(Scene):
 ##############################################
 # SCENE 6: Conclusion (~2 - 3 minutes)
 ##############################################
-class ConclusionScene(Scene):
+class ConclusionScene(FastScene):
     def construct(self):
         self.camera.background_color = BACKGROUND_COLOR
 
@@ -533,4 +548,8 @@ class ConclusionScene(Scene):
 # manim -pqh numbers_to_signals.py IntroScene ComplexNumbersScene ExponentsScene LogsScene EulerScene ConclusionScene
 #
 # Each Scene will render separately, preventing any overlap.
+#
+# To render all six scenes in parallel (one process per scene) and join
+# them into a single numbers_to_signals.mp4:
+# python render_all.py numbers_to_signals.py -q h -j 6
 # ---------------------------------------------------
@@ -1,12 +1,18 @@
 from manim import (
-    Scene, VGroup, Tex, MathTex, Axes, ParametricFunction, Dot, MoveAlongPath,
+    Scene, VGroup, Tex, MathTex, Axes, ParametricFunction, Dot,
     FadeIn, Write, Create, FadeOut, ReplacementTransform, GrowArrow,
     BLUE, YELLOW, RED, GREEN, GRAY, WHITE, UP, DOWN, LEFT, RIGHT, PI,
-    np, ORIGIN, linear, ValueTracker, always_redraw, Circle, Arrow, Line,
-    Arc, Text
+    np, ORIGIN, linear, ValueTracker, Circle, Arrow, Line, Text
 )
 
-class ParkTransformVisualization(Scene):
+from curves import MoveAlongCurve
+from fast_render import FastScene
+from phasors import RotorArc, RotorArrow, TransformTable
+import tex_format
+
+tex_format.install()
+
+class ParkTransformVisualization(FastScene):
     def construct(self):
         # ---------------------- 1. Introduction ----------------------
         title = Tex(r"\textbf{Understanding the Park Transform}", font_size=60, color=BLUE).to_edge(UP)
@@ -48,10 +54,11 @@ class ParkTransformVisualization(Scene):
             MathTex(r"2\pi", font_size=20).next_to(time_axes.c2p(2*PI, 0), DOWN, buff=0.1)
         )
         
+        # Vectorized: t is the whole sample array and c2p maps it in one call
         def get_sine_wave(phase_shift, color):
             return ParametricFunction(
                 lambda t: time_axes.c2p(t, np.sin(t + phase_shift)),
-                t_range=[0, 2*PI], color=color
+                t_range=[0, 2*PI], color=color, use_vectorized=True
             )
         
         phase_a = get_sine_wave(0, RED)
@@ -80,9 +87,9 @@ class ParkTransformVisualization(Scene):
         
         self.play(FadeIn(dot_a), FadeIn(dot_b), FadeIn(dot_c))
         self.play(
-            MoveAlongPath(dot_a, phase_a),
-            MoveAlongPath(dot_b, phase_b),
-            MoveAlongPath(dot_c, phase_c),
+            MoveAlongCurve(dot_a, phase_a),
+            MoveAlongCurve(dot_b, phase_b),
+            MoveAlongCurve(dot_c, phase_c),
             run_time=4, rate_func=linear
         )
         self.wait(1)
@@ -105,41 +112,47 @@ class ParkTransformVisualization(Scene):
         circle = Circle(radius=2, color=WHITE, stroke_width=1).move_to(vector_axes.get_origin())
         
         angle_tracker = ValueTracker(0)
-        
-        def get_vector(angle, color):
-            return always_redraw(lambda: Arrow(
+        # abc, alpha-beta and dq quantities for a whole turn, computed once;
+        # the updaters below only look them up
+        table = TransformTable(angle_tracker)
+        table.add_phasor("ab_label", PI/3)
+        table.add_phasor("bc_label", -PI/3)
+        table.add_park("dq_vector", (1, 0))
+        
+        # Rotors and their labels are built once and moved in place by updaters
+        def get_vector(phase, color):
+            return RotorArrow(
                 vector_axes.get_origin(),
-                vector_axes.c2p(2*np.cos(angle_tracker.get_value() + angle), 
-                                2*np.sin(angle_tracker.get_value() + angle)),
+                lambda: vector_axes.c2p(*(2*table.get(phase))),
                 buff=0, color=color, stroke_width=3
-            ))
+            )
         
-        vecA = get_vector(0, RED)
-        vecB = get_vector(-2*PI/3, GREEN)
-        vecC = get_vector(-4*PI/3, BLUE)
+        vecA = get_vector("a", RED)
+        vecB = get_vector("b", GREEN)
+        vecC = get_vector("c", BLUE)
         
         labels = VGroup(
-            always_redraw(lambda: Tex(r"A", color=RED, font_size=24).next_to(vecA.get_end(), RIGHT, buff=0.1)),
-            always_redraw(lambda: Tex(r"B", color=GREEN, font_size=24).next_to(vecB.get_end(), LEFT, buff=0.1)),
-            always_redraw(lambda: Tex(r"C", color=BLUE, font_size=24).next_to(vecC.get_end(), DOWN, buff=0.1)),
+            Tex(r"A", color=RED, font_size=24).add_updater(lambda m: m.next_to(vecA.get_end(), RIGHT, buff=0.1), call_updater=True),
+            Tex(r"B", color=GREEN, font_size=24).add_updater(lambda m: m.next_to(vecB.get_end(), LEFT, buff=0.1), call_updater=True),
+            Tex(r"C", color=BLUE, font_size=24).add_updater(lambda m: m.next_to(vecC.get_end(), DOWN, buff=0.1), call_updater=True),
         )
         
-        angle_arc_AB = always_redraw(lambda: Arc(
-            radius=0.5, angle=2*PI/3, start_angle=angle_tracker.get_value(), color=YELLOW
-        ))
-        angle_arc_BC = always_redraw(lambda: Arc(
-            radius=0.7, angle=2*PI/3, start_angle=angle_tracker.get_value() - 2*PI/3, color=YELLOW
-        ))
-        
-        angle_labels = VGroup(
-            always_redraw(lambda: MathTex(r"120^\circ", font_size=24, color=YELLOW).move_to(
-                0.9 * np.array([np.cos(angle_tracker.get_value() + PI/3), np.sin(angle_tracker.get_value() + PI/3), 0])
-            )),
-            always_redraw(lambda: MathTex(r"120^\circ", font_size=24, color=YELLOW).move_to(
-                1.1 * np.array([np.cos(angle_tracker.get_value() - PI/3), np.sin(angle_tracker.get_value() - PI/3), 0])
-            ))
+        angle_arc_AB = RotorArc(
+            lambda: (angle_tracker.get_value(), 2*PI/3), radius=0.5, color=YELLOW
+        )
+        angle_arc_BC = RotorArc(
+            lambda: (angle_tracker.get_value() - 2*PI/3, 2*PI/3), radius=0.7, color=YELLOW
         )
         
+        angle_label = MathTex(r"120^\circ", font_size=24, color=YELLOW)
+        angle_labels = VGroup(angle_label, angle_label.copy())
+        angle_labels[0].add_updater(lambda m: m.move_to(
+            0.9 * np.array([*table.get("ab_label"), 0])
+        ), call_updater=True)
+        angle_labels[1].add_updater(lambda m: m.move_to(
+            1.1 * np.array([*table.get("bc_label"), 0])
+        ), call_updater=True)
+        
         self.play(Create(vector_axes), Create(circle))
         self.play(GrowArrow(vecA), Write(labels[0]))
         self.play(GrowArrow(vecB), Write(labels[1]))
@@ -194,40 +207,31 @@ class ParkTransformVisualization(Scene):
         
         angle_tracker.set_value(0)
         
-        vecA = always_redraw(lambda: Arrow(
+        vecA = RotorArrow(
             clarke_axes.get_origin(),
-            clarke_axes.c2p(2*np.cos(angle_tracker.get_value()), 0),
+            lambda: clarke_axes.c2p(2*table.get("abc")[0], 0),
             buff=0, color=RED, stroke_width=3
-        ))
-        vecB = always_redraw(lambda: Arrow(
+        )
+        vecB = RotorArrow(
             clarke_axes.get_origin(),
-            clarke_axes.c2p(
-                2*np.cos(angle_tracker.get_value() - 2*PI/3),
-                2*np.sin(angle_tracker.get_value() - 2*PI/3)
-            ),
+            lambda: clarke_axes.c2p(*(2*table.get("b"))),
             buff=0, color=GREEN, stroke_width=3
-        ))
-        vecC = always_redraw(lambda: Arrow(
+        )
+        vecC = RotorArrow(
             clarke_axes.get_origin(),
-            clarke_axes.c2p(
-                2*np.cos(angle_tracker.get_value() - 4*PI/3),
-                2*np.sin(angle_tracker.get_value() - 4*PI/3)
-            ),
+            lambda: clarke_axes.c2p(*(2*table.get("c"))),
             buff=0, color=BLUE, stroke_width=3
-        ))
+        )
         
-        vec_alpha_beta = always_redraw(lambda: Arrow(
+        vec_alpha_beta = RotorArrow(
             clarke_axes.get_origin(),
-            clarke_axes.c2p(
-                2*np.cos(angle_tracker.get_value()),
-                2*np.sin(angle_tracker.get_value())
-            ),
+            lambda: clarke_axes.c2p(*(2*table.get("alpha_beta"))),
             buff=0, color=YELLOW, stroke_width=5
-        ))
+        )
         
-        alpha_beta_label = always_redraw(lambda: MathTex(r"\alpha\beta", font_size=24, color=YELLOW).next_to(
+        alpha_beta_label = MathTex(r"\alpha\beta", font_size=24, color=YELLOW).add_updater(lambda m: m.next_to(
             vec_alpha_beta.get_end(), UP+RIGHT, buff=0.1
-        ))
+        ), call_updater=True)
         
         circle = Circle(radius=2, color=WHITE, stroke_width=1).move_to(clarke_axes.get_origin())
         
@@ -291,29 +295,29 @@ class ParkTransformVisualization(Scene):
         
         angle_tracker.set_value(0)
         
+        # The dq axes keep their length, so put_start_and_end_on just rotates them
         dq_axes = VGroup(
-            always_redraw(lambda: Line(
-                park_axes.get_origin(),
-                park_axes.c2p(2.5*np.cos(angle_tracker.get_value()), 2.5*np.sin(angle_tracker.get_value())),
-                color=YELLOW, stroke_width=2
-            )),
-            always_redraw(lambda: Line(
-                park_axes.get_origin(),
-                park_axes.c2p(
-                    2.5*np.cos(angle_tracker.get_value() + PI/2),
-                    2.5*np.sin(angle_tracker.get_value() + PI/2)
-                ),
-                color=YELLOW, stroke_width=2
-            ))
+            Line(park_axes.get_origin(), park_axes.c2p(2.5, 0), color=YELLOW, stroke_width=2).add_updater(
+                lambda m: m.put_start_and_end_on(
+                    park_axes.get_origin(),
+                    park_axes.c2p(*(2.5*table.get("d_axis")))
+                ), call_updater=True
+            ),
+            Line(park_axes.get_origin(), park_axes.c2p(0, 2.5), color=YELLOW, stroke_width=2).add_updater(
+                lambda m: m.put_start_and_end_on(
+                    park_axes.get_origin(),
+                    park_axes.c2p(*(2.5*table.get("q_axis")))
+                ), call_updater=True
+            )
         )
         
         dq_labels = VGroup(
-            always_redraw(lambda: Tex(r"d", font_size=24, color=YELLOW).next_to(
-                dq_axes[0].get_end(), RIGHT if np.cos(angle_tracker.get_value()) > 0 else LEFT, buff=0.1
-            )),
-            always_redraw(lambda: Tex(r"q", font_size=24, color=YELLOW).next_to(
-                dq_axes[1].get_end(), UP if np.sin(angle_tracker.get_value() + PI/2) > 0 else DOWN, buff=0.1
-            ))
+            Tex(r"d", font_size=24, color=YELLOW).add_updater(lambda m: m.next_to(
+                dq_axes[0].get_end(), RIGHT if table.get("d_axis")[0] > 0 else LEFT, buff=0.1
+            ), call_updater=True),
+            Tex(r"q", font_size=24, color=YELLOW).add_updater(lambda m: m.next_to(
+                dq_axes[1].get_end(), UP if table.get("q_axis")[1] > 0 else DOWN, buff=0.1
+            ), call_updater=True)
         )
 
         circle = Circle(radius=2, color=WHITE, stroke_width=1).move_to(park_axes.get_origin())
@@ -322,24 +326,21 @@ class ParkTransformVisualization(Scene):
             buff=0, color=GREEN, stroke_width=4
         )
         
-        dq_vector = always_redraw(lambda: Arrow(
+        dq_vector = RotorArrow(
             park_axes.get_origin(),
-            park_axes.c2p(
-                2*np.cos(-angle_tracker.get_value()),
-                2*np.sin(-angle_tracker.get_value())
-            ),
+            lambda: park_axes.c2p(*(2*table.get("dq_vector"))),
             buff=0, color=RED, stroke_width=4
-        ))
+        )
         
-        angle_arc = always_redraw(lambda: Arc(
-            radius=0.5, angle=angle_tracker.get_value(), start_angle=0, color=YELLOW
-        ))
+        angle_arc = RotorArc(
+            lambda: (0, angle_tracker.get_value()), radius=0.5, color=YELLOW
+        )
         
-        angle_label = always_redraw(lambda: MathTex(
+        angle_label = MathTex(
             r"\theta", font_size=24, color=YELLOW
-        ).next_to(
+        ).add_updater(lambda m: m.next_to(
             angle_arc, RIGHT if angle_tracker.get_value() < PI else LEFT, buff=0.1
-        ))
+        ), call_updater=True)
         
         frame_labels = VGroup(
             VGroup(
@@ -0,0 +1,172 @@
+"""
+Phasor primitives that move in place instead of being rebuilt.
+
+always_redraw constructs its mobject from scratch on every frame - for an
+Arrow that is a new shaft, a new tip and new style arrays each time. The
+rotors here are built once and only have their points rewritten from the
+values they follow:
+
+    vec = RotorArrow(axes.get_origin(), lambda: axes.c2p(...), buff=0, color=RED)
+    arc = RotorArc(lambda: (tracker.get_value(), 2*PI/3), radius=0.5, color=YELLOW)
+
+Labels that ride along with them are typeset once and moved by an updater:
+
+    label = Tex("A").add_updater(lambda m: m.next_to(vec.get_end(), RIGHT, buff=0.1))
+"""
+import numpy as np
+
+from manim import ORIGIN, RIGHT, Arc, Arrow
+
+# Control points of a straight cubic Bezier segment
+SEGMENT_ALPHAS = np.array([0, 1 / 3, 2 / 3, 1])[:, None]
+
+
+def _value(x):
+    return x() if callable(x) else x
+
+
+class RotorArrow(Arrow):
+    """Arrow that follows start/end callables by rewriting its points each frame.
+
+    Looks the same as Arrow(start, end, ...) at every position, including the
+    shorter tip and thinner stroke of short arrows.
+    """
+
+    def __init__(self, start, end, **kwargs):
+        self.start_source = start
+        self.end_source = end
+        super().__init__(np.array(_value(start), dtype=float), np.array(_value(end), dtype=float), **kwargs)
+        # Full-size tip pointing along +x with its point at the origin
+        reference = Arrow(ORIGIN, 4 * self.tip_length * RIGHT, buff=0, tip_length=self.tip_length, tip_shape=type(self.tip))
+        self.tip_outline = reference.tip.points - reference.tip.tip_point
+        self.direction = RIGHT.astype(float)
+        if callable(start) or callable(end):
+            self.add_updater(lambda m: m.set_endpoints(_value(m.start_source), _value(m.end_source)))
+
+    def set_endpoints(self, start, end):
+        start = np.asarray(start, dtype=float)
+        end = np.asarray(end, dtype=float)
+        vector = end - start
+        length = np.linalg.norm(vector)
+        # A zero-length arrow keeps pointing where it last pointed
+        if length > 0:
+            self.direction = vector / length
+        direction = self.direction
+        start = start + self.buff * direction
+        end = end - self.buff * direction
+        length = max(length - 2 * self.buff, 0)
+
+        tip_length = min(self.tip_length, self.max_tip_length_to_length_ratio * length)
+        base = end - tip_length * direction
+        if len(self.points) == len(SEGMENT_ALPHAS):
+            self.points[:] = start + SEGMENT_ALPHAS * (base - start)
+        else:
+            self.set_points_as_corners([start, base])
+
+        x, y = direction[:2]
+        rotation = np.array([[x, -y, 0], [y, x, 0], [0, 0, 1]])
+        self.tip.points[:] = end + (tip_length / self.tip_length) * self.tip_outline @ rotation.T
+        self._set_stroke_width_from_length()
+        return self
+
+
+class RotorArc(Arc):
+    """Arc whose (start_angle, angle) follow a callable.
+
+    A change of start_angle alone rotates the existing points; only a change
+    of the swept angle regenerates them. The arc is assumed to stay at its
+    arc_center.
+    """
+
+    def __init__(self, angles, **kwargs):
+        self.angles_source = angles
+        start_angle, angle = _value(angles)
+        super().__init__(start_angle=start_angle, angle=angle, **kwargs)
+        if callable(angles):
+            self.add_updater(lambda m: m.set_angles(*_value(m.angles_source)))
+
+    def set_angles(self, start_angle, angle):
+        if angle != self.angle:
+            self.start_angle = start_angle
+            self.angle = angle
+            self.generate_points()
+        elif start_angle != self.start_angle:
+            self.rotate(start_angle - self.start_angle, about_point=np.asarray(self.arc_center, dtype=float))
+            self.start_angle = start_angle
+        return self
+
+
+# Clarke transform (amplitude invariant) and the phase offsets of a, b, c
+CLARKE = 2 / 3 * np.array([
+    [1, -1 / 2, -1 / 2],
+    [0, np.sqrt(3) / 2, -np.sqrt(3) / 2],
+])
+ABC_OFFSETS = np.array([0, -2 * np.pi / 3, -4 * np.pi / 3])
+
+
+class TransformTable:
+    """Precomputed quantities over one full turn of an angle tracker.
+
+    Every column is a function of theta sampled on the same grid in one
+    vectorized pass; get() interpolates a column at the tracker's current
+    value. The grid position is worked out once per frame and shared by all
+    lookups, so updaters do no trig of their own:
+
+        table = TransformTable(angle_tracker)
+        table.add_phasor("a_120", offset=PI/3)
+        RotorArrow(axes.get_origin(), lambda: axes.c2p(*(2 * table.get("a"))))
+
+    Built-in columns (unit amplitude, theta = electrical angle):
+        "a", "b", "c"   phasors of the three phases, as (x, y)
+        "abc"           instantaneous phase values (i_a, i_b, i_c)
+        "alpha_beta"    Clarke transform of "abc"
+        "d_axis", "q_axis"  unit vectors of the rotating dq frame
+    """
+
+    def __init__(self, tracker, samples=2048):
+        self.tracker = tracker
+        self.samples = samples
+        # One extra sample so the last interval interpolates up to 2*pi
+        self.theta = np.linspace(0, 2 * np.pi, samples + 1)
+        self.columns = {}
+        self._value = None
+        self._position = (0, 0.0)
+
+        theta = self.theta
+        abc = np.cos(theta + ABC_OFFSETS[:, None])
+        for name, offset in zip("abc", ABC_OFFSETS):
+            self.add_phasor(name, offset)
+        self.add("abc", abc)
+        self.add("alpha_beta", CLARKE @ abc)
+        self.add_phasor("d_axis")
+        self.add_phasor("q_axis", np.pi / 2)
+
+    def add(self, name, values):
+        """Store values (components x samples+1, sampled on self.theta) as a column."""
+        self.columns[name] = np.asarray(values, dtype=float).T
+        return self
+
+    def add_phasor(self, name, offset=0.0, harmonic=1):
+        """Column of the unit phasor at harmonic * theta + offset."""
+        angle = harmonic * self.theta + offset
+        return self.add(name, [np.cos(angle), np.sin(angle)])
+
+    def add_park(self, name, alpha_beta):
+        """Column of the fixed stationary-frame vector alpha_beta seen in the dq frame."""
+        alpha, beta = alpha_beta
+        cos, sin = np.cos(self.theta), np.sin(self.theta)
+        return self.add(name, [alpha * cos + beta * sin, -alpha * sin + beta * cos])
+
+    def position(self):
+        value = self.tracker.get_value()
+        if value != self._value:
+            index, fraction = divmod((value % (2 * np.pi)) / (2 * np.pi) * self.samples, 1)
+            index = min(int(index), self.samples - 1)
+            self._value = value
+            self._position = (index, fraction)
+        return self._position
+
+    def get(self, name):
+        index, fraction = self.position()
+        column = self.columns[name]
+        return column[index] + fraction * (column[index + 1] - column[index])
@@ -0,0 +1,234 @@
+"""
+Per-play profile of a scene render.
+
+    python play_profile.py leetcode04.py MatrixRotation -q l -o profile
+
+renders the scene (every scene of the file if none is named) and writes
+profile.json plus a text report, profile.txt. Every play()/wait() becomes one
+record with the wall time it cost, split into
+
+    construct       construct() code run since the previous play ended
+                    (building mobjects, Tex, layout)
+    setup           the rest of play(): compiling and beginning animations
+    updaters        Scene.update_mobjects
+    interpolation   the animations' interpolate/update (Scene.update_to_time)
+    rasterization   drawing frames and cached layers
+    encoding        frames written to ffmpeg, partial movies opened and closed
+
+Each category is exclusive: time spent in an inner one (updaters inside
+update_to_time, frame writes inside render) is only counted there. A record
+also holds the source line of the play() call, the animations it ran, and
+the number of mobjects and points on screen when it ended. The report lists
+the plays by wall time and sums them per source line.
+
+From code, wrap a render yourself:
+
+    profiler = play_profile.install()
+    SomeScene().render()
+    profiler.write("profile")
+"""
+import functools
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import manim
+from manim import Scene
+
+CATEGORIES = ("construct", "setup", "updaters", "interpolation", "rasterization", "encoding")
+MANIM_DIR = os.path.dirname(manim.__file__)
+FINISHED = "(scene finished)"
+
+
+def caller_line():
+    """file:line and function of the innermost frame outside manim and this module."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        file_name = frame.f_code.co_filename
+        if not file_name.startswith(MANIM_DIR) and file_name != __file__:
+            return f"{os.path.basename(file_name)}:{frame.f_lineno}", frame.f_code.co_name
+        frame = frame.f_back
+    return "?", "?"
+
+
+class PlayProfiler:
+    def __init__(self):
+        self.records = []
+        self.scenes = []
+        self.record = None
+        self.stack = []
+        self.mark = None
+        self.last_end = None
+
+    # Exclusive timing: entering a category pauses the one it was entered from
+    def enter(self, category):
+        now = time.perf_counter()
+        if self.stack:
+            self.charge(self.stack[-1], now - self.mark)
+        self.stack.append(category)
+        self.mark = now
+
+    def leave(self):
+        now = time.perf_counter()
+        self.charge(self.stack.pop(), now - self.mark)
+        self.mark = now
+
+    def charge(self, category, seconds):
+        if self.record is not None:
+            self.record[category] += seconds
+
+    def timed(self, category, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.enter(category)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.leave()
+        return wrapper
+
+    def play_wrapper(self, scene, function, label=None):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.begin_record(scene, label)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end_record(scene)
+        return wrapper
+
+    def begin_record(self, scene, label):
+        start = time.perf_counter()
+        source, function = caller_line()
+        self.record = {
+            "scene": type(scene).__name__,
+            "index": sum(1 for r in self.records if r["scene"] == type(scene).__name__),
+            "source": source,
+            "function": function,
+            "label": label,
+            "animation_start": scene.renderer.time,
+            **{category: 0.0 for category in CATEGORIES},
+        }
+        self.record["construct"] = start - self.last_end
+        self.record["wall_start"] = start
+        self.enter("setup")
+
+    def end_record(self, scene):
+        self.leave()
+        record = self.record
+        self.record = None
+        end = time.perf_counter()
+        family = scene.get_mobject_family_members()
+        record["label"] = record["label"] or ", ".join(type(a).__name__ for a in scene.animations or [])
+        record["run_time"] = scene.renderer.time - record.pop("animation_start")
+        record["wall"] = record["construct"] + (end - record.pop("wall_start"))
+        record["mobjects"] = len(family)
+        record["points"] = int(sum(len(mob.points) for mob in family))
+        self.records.append(record)
+        self.last_end = end
+
+    def attach(self, scene):
+        """Wrap the methods of one scene, its renderer and its file writer."""
+        renderer = scene.renderer
+        writer = renderer.file_writer
+        scene.update_mobjects = self.timed("updaters", scene.update_mobjects)
+        scene.update_to_time = self.timed("interpolation", scene.update_to_time)
+        for name in ("update_frame", "render", "save_static_frame_data", "freeze_current_frame"):
+            setattr(renderer, name, self.timed("rasterization", getattr(renderer, name)))
+        for name in ("begin_animation", "end_animation", "write_frame", "finish"):
+            setattr(writer, name, self.timed("encoding", getattr(writer, name)))
+        renderer.play = self.play_wrapper(scene, renderer.play)
+        renderer.scene_finished = self.play_wrapper(scene, renderer.scene_finished, FINISHED)
+
+    def render(self, scene, render, *args, **kwargs):
+        start = time.perf_counter()
+        self.attach(scene)
+        self.last_end = start
+        try:
+            return render(scene, *args, **kwargs)
+        finally:
+            self.scenes.append({
+                "scene": type(scene).__name__,
+                "wall": time.perf_counter() - start,
+                "run_time": scene.renderer.time,
+                "plays": sum(1 for r in self.records if r["scene"] == type(scene).__name__ and r["label"] != FINISHED),
+            })
+
+    def by_source(self):
+        lines = defaultdict(lambda: {"calls": 0, "wall": 0.0, **{category: 0.0 for category in CATEGORIES}})
+        for record in self.records:
+            line = lines[(record["scene"], record["source"], record["function"])]
+            line["calls"] += 1
+            for key in ("wall", *CATEGORIES):
+                line[key] += record[key]
+        return sorted(
+            ({"scene": scene, "source": source, "function": function, **line}
+             for (scene, source, function), line in lines.items()),
+            key=lambda line: line["wall"], reverse=True,
+        )
+
+    def report(self, top=40):
+        header = "  ".join(f"{name[:9]:>9}" for name in ("wall", *CATEGORIES))
+        lines = []
+        for scene in self.scenes:
+            lines.append(
+                f"{scene['scene']}: {scene['plays']} plays, {scene['wall']:.2f} s wall, "
+                f"{scene['run_time']:.2f} s of animation"
+            )
+        lines += ["", f"Plays by wall time (top {top}), seconds:", f"{header}  {'mobjects':>8}  {'points':>8}  source"]
+        for record in sorted(self.records, key=lambda r: r["wall"], reverse=True)[:top]:
+            times = "  ".join(f"{record[key]:9.3f}" for key in ("wall", *CATEGORIES))
+            lines.append(
+                f"{times}  {record['mobjects']:8d}  {record['points']:8d}  "
+                f"{record['source']} #{record['index']} {record['label']}"
+            )
+        lines += ["", "By source line, seconds:", f"{header}  {'calls':>8}  source"]
+        for line in self.by_source():
+            times = "  ".join(f"{line[key]:9.3f}" for key in ("wall", *CATEGORIES))
+            lines.append(f"{times}  {line['calls']:8d}  {line['source']} in {line['scene']}.{line['function']}")
+        return "\n".join(lines)
+
+    def write(self, output, top=40):
+        output = Path(output)
+        with open(output.with_suffix(".json"), "w") as f:
+            json.dump({"scenes": self.scenes, "plays": self.records, "by_source": self.by_source()}, f, indent=1)
+        report = self.report(top)
+        output.with_suffix(".txt").write_text(report + "\n")
+        return report
+
+
+def install():
+    """Profile every Scene.render() in this process; returns the PlayProfiler collecting them."""
+    profiler = PlayProfiler()
+    original_render = Scene.render
+
+    def _render(self, *args, **kwargs):
+        return profiler.render(self, original_render, *args, **kwargs)
+
+    Scene.render = _render
+    return profiler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from manim import tempconfig
+    from render_all import QUALITIES, find_scenes, load_module
+
+    parser = argparse.ArgumentParser(description="Render scenes and report where each play() spends its time.")
+    parser.add_argument("file", help="scene file, e.g. leetcode04.py")
+    parser.add_argument("scenes", nargs="*", help="scenes to render (default: all in the file)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    parser.add_argument("-o", "--output", default="profile", help="writes <output>.json and <output>.txt")
+    parser.add_argument("--top", type=int, default=40, help="plays listed in the report")
+    args = parser.parse_args()
+
+    module = load_module(args.file)
+    profiler = install()
+    with tempconfig({"quality": QUALITIES[args.quality], "disable_caching": True}):
+        for scene_name in args.scenes or find_scenes(args.file):
+            getattr(module, scene_name)().render()
+    print(profiler.write(args.output, args.top))
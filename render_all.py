@@ -0,0 +1,219 @@
+"""
+Render every Scene in a file in parallel and join them into one video.
+
+    python render_all.py numbers_to_signals.py -q h -j 4
+
+Each Scene subclass gets its own `manim` worker process (and its own media
+directory, so workers never race on the Tex/partial-movie folders). When all
+workers are done the scene videos are joined in declaration order with
+ffmpeg's concat demuxer, without re-encoding.
+
+A long scene can also be split in time:
+
+    python render_all.py park.py -q h -j 8 --slices 8
+
+Each scene's construct() is first run without rendering (see dry_run.py) to
+measure every play()/wait(). The plays are cut into contiguous ranges of
+about equal duration, and each range is rendered by its own worker with
+manim's -n first,last: the worker replays construct() with the plays
+before its range skipped, which rebuilds the scene state at its first play,
+then renders only its range. The slices are joined like whole scenes. The
+dry run compiles the scene's LaTeX into a Tex folder that every slice of
+the scene then reads from, so each formula is compiled once.
+"""
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# manim's quality presets by their -q flag
+QUALITIES = {
+    "l": "low_quality", "m": "medium_quality", "h": "high_quality",
+    "p": "production_quality", "k": "fourk_quality",
+}
+
+
+def load_module(file_name):
+    file_name = Path(file_name).resolve()
+    module = sys.modules.get(file_name.stem)
+    if module is not None and getattr(module, "__file__", None) == str(file_name):
+        return module
+    sys.path.insert(0, str(file_name.parent))
+    spec = importlib.util.spec_from_file_location(file_name.stem, file_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[file_name.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def find_scenes(file_name):
+    """Names of the Scene subclasses defined in file_name, in declaration order."""
+    from manim import Scene
+
+    module = load_module(file_name)
+    return [
+        name for name, obj in vars(module).items()
+        if isinstance(obj, type) and issubclass(obj, Scene)
+        and obj.__module__ == module.__name__
+    ]
+
+
+def play_durations(file_name, scene_name):
+    """Duration of every play()/wait() call of scene_name, from a dry run of its construct()."""
+    from dry_run import dry_run
+
+    scene = dry_run(getattr(load_module(file_name), scene_name))
+    return scene.renderer.play_durations
+
+
+def split_plays(durations, slices):
+    """Contiguous (first, last) play ranges, at most slices of them, of about equal duration."""
+    slices = max(1, min(slices, len(durations) - 1))
+    total = sum(durations)
+    ranges = []
+    first = 0
+    elapsed = 0.0
+    for i, duration in enumerate(durations[:-1]):
+        elapsed += duration
+        # manim ignores an upper bound of 0 (-n 0,0 renders everything), so play 0 never ends a range
+        if i and len(ranges) < slices - 1 and elapsed >= total * (len(ranges) + 1) / slices:
+            ranges.append((first, i))
+            first = i + 1
+    ranges.append((first, len(durations) - 1))
+    return ranges
+
+
+def quality_folder(quality):
+    """Folder manim names after a quality preset, e.g. 1080p60 for h."""
+    from manim.constants import QUALITIES as PRESETS
+
+    preset = PRESETS[QUALITIES[quality]]
+    return f"{preset['pixel_height']}p{preset['frame_rate']:g}"
+
+
+def find_scene_video(media_dir, scene_name, folder):
+    # manim writes to <media_dir>/videos/<module>/<quality folder>/<Scene>.mp4; other
+    # quality folders hold videos of earlier renders
+    matches = sorted(Path(media_dir).glob(f"videos/*/{folder}/{scene_name}.mp4"))
+    return matches[-1] if matches else None
+
+
+def slice_config(media_root, scene_name):
+    """Config file pointing a scene's slices at one shared Tex folder; returns (config file, Tex folder)."""
+    scene_dir = (Path(media_root) / scene_name).resolve()
+    tex_dir = scene_dir / "Tex"
+    config_file = scene_dir / "slices.cfg"
+    scene_dir.mkdir(parents=True, exist_ok=True)
+    config_file.write_text(f"[CLI]\ntex_dir = {tex_dir}\n")
+    return config_file, tex_dir
+
+
+def render_scene(file_name, scene_name, quality, media_root, extra_args, plays=None, config_file=None):
+    """Render scene_name (only plays first..last if plays is given); returns (label, video, seconds)."""
+    media_dir = Path(media_root) / scene_name
+    label = scene_name
+    if plays is not None:
+        media_dir = media_dir / f"plays_{plays[0]:04d}_{plays[1]:04d}"
+        label = f"{scene_name}[{plays[0]}-{plays[1]}]"
+        extra_args = ["-n", f"{plays[0]},{plays[1]}", *extra_args]
+    if config_file is not None:
+        extra_args = ["--config_file", str(config_file), *extra_args]
+    media_dir.mkdir(parents=True, exist_ok=True)
+    command = [
+        sys.executable, "-m", "manim", "render", f"-q{quality}",
+        "--media_dir", str(media_dir),
+        "--progress_bar", "none",
+        *extra_args,
+        str(file_name), scene_name,
+    ]
+    start = time.perf_counter()
+    with open(media_dir / "render.log", "w") as log:
+        result = subprocess.run(command, stdout=log, stderr=subprocess.STDOUT)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        return label, None, elapsed
+    return label, find_scene_video(media_dir, scene_name, quality_folder(quality)), elapsed
+
+
+def concat_videos(videos, output):
+    output = Path(output)
+    list_file = output.with_suffix(".txt")
+    with open(list_file, "w") as f:
+        for video in videos:
+            path = str(Path(video).resolve()).replace("'", r"'\''")
+            f.write(f"file '{path}'\n")
+    command = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "concat", "-safe", "0", "-i", str(list_file),
+        "-c", "copy", str(output),
+    ]
+    subprocess.run(command, check=True)
+    list_file.unlink()
+    return output
+
+
+def render_all(file_name, quality="h", jobs=None, output=None, media_dir="media/render_all", extra_args=(), slices=1):
+    file_name = Path(file_name)
+    scenes = find_scenes(file_name)
+    if not scenes:
+        raise SystemExit(f"No Scene subclasses found in {file_name}")
+    jobs = jobs or os.cpu_count() or 1
+    media_root = Path(media_dir) / file_name.stem
+
+    # (scene, plays, config file) work items in output order; plays None renders the whole scene
+    items = []
+    for scene in scenes:
+        durations = []
+        if slices > 1:
+            from manim import tempconfig
+
+            # Compile the LaTeX where the slices will look for it
+            config_file, tex_dir = slice_config(media_root, scene)
+            with tempconfig({"tex_dir": str(tex_dir)}):
+                durations = play_durations(file_name, scene)
+        if len(durations) > 2:
+            items += [(scene, plays, config_file) for plays in split_plays(durations, slices)]
+        else:
+            items.append((scene, None, None))
+    print(f"Rendering {len(scenes)} scenes ({len(items)} slices) from {file_name} with {jobs} workers")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(render_scene, file_name, scene, quality, media_root, list(extra_args), plays, config_file)
+            for scene, plays, config_file in items
+        ]
+        results = []
+        for (scene_name, _, _), future in zip(items, futures):
+            label, video, elapsed = future.result()
+            status = video if video else f"FAILED (see the render.log under {media_root / scene_name})"
+            print(f"  {label:<28} {elapsed:7.1f}s  {status}")
+            results.append((label, video))
+
+    failed = [label for label, video in results if video is None]
+    if failed:
+        raise SystemExit(f"Failed scenes: {', '.join(failed)}")
+
+    output = concat_videos([video for _, video in results], output or f"{file_name.stem}.mp4")
+    print(f"Joined {len(results)} videos into {output} in {time.perf_counter() - start:.1f}s")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render all scenes of a file in parallel and join them.")
+    parser.add_argument("file", help="scene file, e.g. numbers_to_signals.py")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", default=None, help="joined video (default: <file>.mp4)")
+    parser.add_argument("--media_dir", default="media/render_all")
+    parser.add_argument("--slices", type=int, default=1, help="split each scene into this many time slices")
+    args, extra_args = parser.parse_known_args()
+    render_all(args.file, args.quality, args.jobs, args.output, args.media_dir, extra_args, args.slices)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Per-scene video cache keyed on what the scene is made of.
+
+manim decides what to re-render play by play, which means running every
+construct() of a file and hashing every animation even when only one scene
+changed. This cache fingerprints a whole Scene class instead:
+
+  * its normalized source AST (formatting and comments do not count),
+  * the module-level functions, classes and constants it references, and
+    theirs in turn (bullet_item, TITLE_COLOR, ...), plus the module's
+    top-level statements such as imports and install() calls,
+  * every local module imported by the file (fast_render, curves, ...),
+    whole and recursively, and any file in the directory a string literal
+    names (container_problem.png),
+  * the manim version and the render config (resolution, frame rate,
+    background, output format).
+
+If a video with the same fingerprint was rendered before, it is copied into
+place and construct() is never run. The cache directory defaults to
+~/.cache/manim_scenes (MANIM_SCENE_CACHE moves it) and is kept under a size
+cap by evicting the least recently used videos.
+
+Usage (at the top of a scene file, after the other installs):
+
+    import scene_cache
+    scene_cache.install()
+"""
+import ast
+import hashlib
+import inspect
+import math
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from manim import Scene, __version__, config, logger
+from manim.utils.file_ops import is_png_format, open_media_file, write_to_movie
+
+CACHE_VERSION = "1"
+DEFAULT_CACHE_DIR = Path(os.environ.get("MANIM_SCENE_CACHE", Path.home() / ".cache" / "manim_scenes"))
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+CONFIG_KEYS = (
+    "pixel_width", "pixel_height", "frame_rate", "frame_width", "frame_height",
+    "background_color", "background_opacity", "movie_file_extension", "transparent", "renderer",
+)
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Assign, ast.AnnAssign, ast.AugAssign)
+
+
+def defined_names(statement):
+    if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [statement.name]
+    targets = statement.targets if isinstance(statement, ast.Assign) else [statement.target]
+    return [node.id for target in targets for node in ast.walk(target) if isinstance(node, ast.Name)]
+
+
+def referenced_names(node):
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+
+
+def local_imports(tree, directory):
+    """Paths of the modules in directory that tree imports."""
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.append(node.module)
+    paths = [directory / f"{name.split('.')[0]}.py" for name in names]
+    return sorted({path for path in paths if path.is_file()})
+
+
+def named_files(nodes, directory):
+    """Files in directory named by a string literal in nodes."""
+    files = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Constant) and isinstance(child.value, str) and 0 < len(child.value) < 256:
+                path = directory / child.value
+                try:
+                    if path.is_file():
+                        files.add(path)
+                except OSError:
+                    continue
+    return sorted(files)
+
+
+def module_digest(path, seen=None):
+    """Digest of a local module's AST and, recursively, of the local modules it imports."""
+    seen = set() if seen is None else seen
+    path = Path(path).resolve()
+    if path in seen:
+        return b""
+    seen.add(path)
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    h = hashlib.blake2b(ast.dump(tree).encode(), digest_size=16)
+    for imported in local_imports(tree, path.parent):
+        h.update(module_digest(imported, seen))
+    return h.digest()
+
+
+def scene_fingerprint(scene_class):
+    """Hex digest of everything scene_class's video depends on."""
+    path = Path(inspect.getsourcefile(scene_class)).resolve()
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    definitions = {}
+    kept = []
+    for statement in tree.body:
+        if isinstance(statement, DEFINITIONS):
+            for name in defined_names(statement):
+                definitions.setdefault(name, []).append(statement)
+        else:
+            kept.append(statement)
+
+    # The class, then whatever module-level definitions it (transitively) refers to
+    pending = list(definitions[scene_class.__name__]) + kept
+    included = {}
+    while pending:
+        statement = pending.pop()
+        if id(statement) in included:
+            continue
+        included[id(statement)] = statement
+        for name in referenced_names(statement):
+            pending += definitions.get(name, [])
+    included = sorted(included.values(), key=lambda statement: statement.lineno)
+
+    h = hashlib.sha256("\0".join([CACHE_VERSION, __version__, scene_class.__name__]).encode())
+    for statement in included:
+        h.update(ast.dump(statement).encode())
+    for imported in local_imports(tree, path.parent):
+        if imported != path:
+            h.update(module_digest(imported))
+    for data_file in named_files(included, path.parent):
+        h.update(data_file.name.encode())
+        h.update(hashlib.sha256(data_file.read_bytes()).digest())
+    for key in CONFIG_KEYS:
+        h.update(f"{key}={config[key]}".encode())
+    return h.hexdigest()
+
+
+class SceneCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def path(self, key):
+        return self.cache_dir / f"{key}{config['movie_file_extension']}"
+
+    def get(self, key, destination):
+        """Copy the video stored under key to destination; False on a miss."""
+        path = self.path(key)
+        try:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, destination)
+            os.utime(path)  # mark as recently used for LRU eviction
+        except OSError:
+            return False
+        return True
+
+    def put(self, key, video):
+        # Copy to a temporary file first so concurrent renders never read half a video
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(video, tmp_name)
+        os.replace(tmp_name, self.path(key))
+        self.evict()
+
+    def entries(self):
+        return [entry for entry in os.scandir(self.cache_dir) if not entry.name.endswith(".tmp")]
+
+    def evict(self):
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self.entries()]
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        # Drop the least recently used videos until we are comfortably under the cap
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= 0.9 * self.max_bytes:
+                break
+
+    def clear(self):
+        for entry in self.entries():
+            os.remove(entry.path)
+
+
+cache = None
+_original_render = Scene.render
+
+
+def cacheable():
+    # Only whole-scene movies: no frames as images, sections or partial (-n) renders
+    return (
+        write_to_movie() and not is_png_format() and not config["dry_run"]
+        and not config["save_sections"] and not config["save_last_frame"]
+        # manim stores the default upto_animation_number (-1) as infinity
+        and not config["from_animation_number"] and math.isinf(config["upto_animation_number"])
+    )
+
+
+def modified_time(path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _render(self, preview=False):
+    if not cacheable():
+        return _original_render(self, preview)
+    key = scene_fingerprint(type(self))
+    movie_file = Path(self.renderer.file_writer.movie_file_path)
+    if cache.get(key, movie_file):
+        logger.info(f"{type(self).__name__} is unchanged, reused {movie_file}")
+        self.renderer.file_writer.print_file_ready_message(str(movie_file))
+        # What Scene.render does after writing the movie (-p, -f)
+        if preview:
+            config["preview"] = True
+        if config["preview"] or config["show_in_file_browser"]:
+            open_media_file(self.renderer.file_writer)
+        return None
+    previous = modified_time(movie_file)
+    result = _original_render(self, preview)
+    # Only a movie this render wrote, not one left over from an earlier run
+    written = modified_time(movie_file)
+    if written is not None and written != previous:
+        cache.put(key, movie_file)
+    return result
+
+
+def install(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """Reuse the video of any scene of this process whose fingerprint is in the cache."""
+    global cache, _original_render
+    cache = SceneCache(cache_dir, max_bytes)
+    # Wrap whatever render is installed now (tex_batch's), so a hit skips it too
+    _original_render = Scene.render
+    Scene.render = _render
+    return cache
+
+
+def uninstall():
+    Scene.render = _original_render
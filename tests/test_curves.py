@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import PI, UP, Axes, ParametricFunction, VMobject
+
+from curves import arc_length_table, crossings, point_from_proportion, pwm_curve, pwm_levels
+
+PROPORTIONS = [0, 0.1, 0.25, 0.5, 0.73, 0.999, 1]
+
+
+def test_point_from_proportion_matches_manim():
+    curve = ParametricFunction(lambda t: np.array([t, np.sin(3 * t), 0]), t_range=[-3, 3])
+    for alpha in PROPORTIONS:
+        expected = VMobject.point_from_proportion(curve, alpha)
+        assert np.allclose(point_from_proportion(curve, alpha), expected)
+
+
+def test_point_from_proportion_on_a_polyline_is_exact():
+    corners = np.array([[0, 0, 0], [3, 0, 0], [3, 4, 0], [0, 4, 0]], dtype=float)
+    polyline = VMobject().set_points_as_corners(corners)
+    # Side lengths 3, 4, 3: the path is 10 long
+    expected = {0: [0, 0, 0], 0.15: [1.5, 0, 0], 0.5: [3, 2, 0], 0.85: [1.5, 4, 0], 1: [0, 4, 0]}
+    for alpha, point in expected.items():
+        assert np.allclose(point_from_proportion(polyline, alpha), point)
+
+
+def test_table_follows_in_place_and_replaced_points():
+    polyline = VMobject().set_points_as_corners([[0, 0, 0], [2, 0, 0]])
+    table = arc_length_table(polyline)
+    assert arc_length_table(polyline) is table
+    polyline.shift(UP)
+    assert np.allclose(point_from_proportion(polyline, 0.5), [1, 1, 0])
+    polyline.stretch(2, 0)
+    assert np.allclose(point_from_proportion(polyline, 0.25), [0, 1, 0])
+    polyline.set_points_as_corners([[0, 0, 0], [0, 6, 0]])
+    assert np.allclose(point_from_proportion(polyline, 0.5), [0, 3, 0])
+    current = arc_length_table(polyline)
+    rebuilt = arc_length_table(polyline, rebuild=True)
+    assert rebuilt is not current and arc_length_table(polyline) is rebuilt
+
+
+def test_crossings_at_exact_samples():
+    # 0.5 is a grid point: a sign change there is one crossing, a touch is none
+    assert np.allclose(crossings(lambda x: x - 0.5, 0, 1), [0.5])
+    assert np.allclose(crossings(lambda x: 0.5 - x, 0, 1), [0.5])
+    assert len(crossings(lambda x: (x - 0.5) ** 2, 0, 1)) == 0
+    assert len(crossings(lambda x: -((x - 0.5) ** 2), 0, 1)) == 0
+
+
+def test_crossings_between_samples():
+    edges = crossings(lambda x: np.sin(2 * PI * x) - 0.3, 0, 1)
+    expected = [np.arcsin(0.3) / (2 * PI), 0.5 - np.arcsin(0.3) / (2 * PI)]
+    assert np.allclose(edges, expected, atol=1e-9)
+
+
+def pwm_inputs():
+    reference = lambda x: 0.8 * np.sin(2 * PI * x)
+    # Triangle carrier with 5 periods on [0, 1]
+    carrier = lambda x: 4 * np.abs((5 * x) % 1.0 - 0.5) - 1
+    return reference, carrier
+
+
+def test_pwm_levels():
+    reference, carrier = pwm_inputs()
+    xs, ys = pwm_levels(reference, carrier, 0, 1, high=2, low=-1)
+    edges = crossings(lambda x: reference(x) - carrier(x), 0, 1)
+    assert len(xs) == len(ys) == 2 * len(edges) + 2
+    assert xs[0] == 0 and xs[-1] == 1
+    assert np.all(np.diff(xs) >= 0)
+    # Vertical edges at each switching instant, levels alternating between them
+    assert np.array_equal(xs[1:-1:2], xs[2:-1:2])
+    assert set(ys) == {2, -1}
+    assert np.array_equal(ys[0::2], ys[1::2])
+    assert np.all(ys[2::2] != ys[:-2:2])
+    middles = (xs[0::2] + xs[1::2]) / 2
+    assert np.array_equal(ys[0::2] == 2, reference(middles) > carrier(middles))
+
+
+def test_pwm_curve_vertices():
+    reference, carrier = pwm_inputs()
+    axes = Axes(x_range=[0, 1, 0.1], y_range=[0, 1, 0.5])
+    curve = pwm_curve(axes, reference, carrier)
+    xs, ys = pwm_levels(reference, carrier, 0, 1)
+    assert curve.get_num_curves() == len(xs) - 1
+    corners = np.vstack([curve.get_start_anchors(), curve.get_end_anchors()[-1:]])
+    assert np.allclose(corners, axes.c2p(xs, ys).T)
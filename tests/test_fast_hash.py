@@ -0,0 +1,85 @@
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import Dot, config, tempconfig
+
+import fast_hash
+
+SCALE = 1.0
+
+
+def grow(mob):
+    mob.scale(SCALE)
+
+
+def use_config(mob):
+    mob.set_x(config.frame_width / 4)
+
+
+def play_hash(*mobjects):
+    return fast_hash.get_hash_from_play_call(object(), object(), [], list(mobjects))
+
+
+def counter():
+    value = 1.0
+
+    def read(mob):
+        mob.scale(value)
+
+    def write(new_value):
+        nonlocal value
+        value = new_value
+
+    return read, write
+
+
+def test_unchanged_mobjects_hash_the_same():
+    dot = Dot()
+    dot.add_updater(grow)
+    assert play_hash(dot) == play_hash(dot)
+
+
+def test_rebinding_a_global_changes_the_hash():
+    global SCALE
+    dot = Dot()
+    dot.add_updater(grow)
+    before = play_hash(dot)
+    SCALE = 2.0
+    try:
+        assert play_hash(dot) != before
+    finally:
+        SCALE = 1.0
+
+
+def test_rebinding_a_closure_cell_in_a_list_changes_the_hash():
+    read, write = counter()
+    dot = Dot()
+    dot.add_updater(read)
+    before = play_hash(dot)
+    write(3.0)
+    assert play_hash(dot) != before
+
+
+def test_rebinding_a_closure_cell_in_a_dict_changes_the_hash():
+    read, write = counter()
+    dot = Dot()
+    dot.handlers = {"scale": read}
+    before = play_hash(dot)
+    write(3.0)
+    assert play_hash(dot) != before
+
+
+def test_moving_points_in_place_changes_the_hash():
+    dot = Dot()
+    before = play_hash(dot)
+    dot.points[0, 0] += 1
+    assert play_hash(dot) != before
+
+
+def test_manim_config_does_not_change_the_hash():
+    dot = Dot()
+    dot.add_updater(use_config)
+    before = play_hash(dot)
+    with tempconfig({"verbosity": "ERROR", "disable_caching": True}):
+        assert play_hash(dot) == before
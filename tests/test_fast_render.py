@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import LEFT, RIGHT, Dot, ImageMobject, LineJointType, Square, Triangle, ValueTracker, Wait, tempconfig
+
+from fast_render import FastScene, TiledCamera
+
+
+class DotUnderImage(FastScene):
+    def construct(self):
+        dot = Dot(LEFT * 3, radius=0.5)
+        image = ImageMobject(np.full((8, 8, 4), (255, 0, 0, 255), dtype=np.uint8)).scale_to_fit_height(3)
+        self.add(dot, image)
+        self.play(dot.animate.shift(RIGHT * 6), run_time=1)
+
+
+def render_frames(scene_class, tmp_path):
+    frames = []
+    with tempconfig({
+        "pixel_width": 160, "pixel_height": 90, "frame_rate": 15,
+        "write_to_movie": False, "disable_caching": True, "media_dir": str(tmp_path),
+    }):
+        scene = scene_class()
+        scene.renderer.add_frame = lambda frame, num_frames=1: frames.append(np.array(frame))
+        scene.render()
+    return frames
+
+
+def test_dirty_regions_redraw_images_over_changes(tmp_path):
+    reference = type("DotUnderImageFull", (DotUnderImage,), {"cache_layers": False})
+    expected = render_frames(reference, tmp_path / "full")
+    frames = render_frames(DotUnderImage, tmp_path / "dirty")
+    assert len(frames) == len(expected)
+    for frame, expected_frame in zip(frames, expected):
+        assert np.array_equal(frame, expected_frame)
+
+
+class SharpCorners(FastScene):
+    def construct(self):
+        # The triangle leaves its join style AUTO: it strokes with the square's bevel
+        square = Square(joint_type=LineJointType.BEVEL, stroke_width=40).shift(LEFT * 3)
+        triangle = Triangle(stroke_width=40).scale(2)
+        self.add(square, triangle)
+        self.play(triangle.animate.shift(RIGHT * 3), run_time=1)
+
+
+def test_tiled_render_matches_serial(tmp_path):
+    tiled = type("SharpCornersTiled", (SharpCorners,), {"tile_workers": 4})
+    expected = render_frames(SharpCorners, tmp_path / "serial")
+    frames = render_frames(tiled, tmp_path / "tiled")
+    assert len(frames) == len(expected)
+    for frame, expected_frame in zip(frames, expected):
+        assert np.array_equal(frame, expected_frame)
+
+
+def test_band_contexts_follow_the_pixel_array():
+    camera = TiledCamera()
+    camera.tile_workers = 3
+    pixel_array = camera.pixel_array
+    bands = camera.get_band_contexts(pixel_array)
+    assert len(bands) == 3
+    assert camera.get_band_contexts(pixel_array) is bands
+    assert camera.get_band_contexts(pixel_array.copy()) is not bands
+
+
+def test_updater_records_are_pruned(tmp_path):
+    with tempconfig({"write_to_movie": False, "disable_caching": True, "media_dir": str(tmp_path)}):
+        scene = FastScene()
+        tracker = ValueTracker(0)
+        kept, removed, cleared = Dot(), Dot(), Dot()
+        for dot in (kept, removed, cleared):
+            dot.add_updater(lambda m: m.set_x(tracker.get_value()))
+        scene.add(kept, removed, cleared)
+        scene.play(tracker.animate.set_value(1), run_time=0.1)
+        assert {key[0] for key in scene.updater_inputs} == {id(kept), id(removed), id(cleared)}
+        scene.remove(removed)
+        cleared.clear_updaters()
+        scene.play(Wait(0.1))
+        assert {key[0] for key in scene.updater_inputs} == {id(kept)}
+        assert set(scene.updater_takes_dt) == set(kept.updaters)
@@ -0,0 +1,20 @@
+import pytest
+
+from render_all import find_scene_video, quality_folder
+
+
+def test_find_scene_video_picks_the_requested_quality(tmp_path):
+    for folder in ("1080p60", "480p15"):
+        video = tmp_path / "videos" / "numbers_to_signals" / folder / "LogsScene.mp4"
+        video.parent.mkdir(parents=True)
+        video.write_bytes(folder.encode())
+    assert find_scene_video(tmp_path, "LogsScene", "1080p60").read_bytes() == b"1080p60"
+    assert find_scene_video(tmp_path, "LogsScene", "480p15").read_bytes() == b"480p15"
+    assert find_scene_video(tmp_path, "LogsScene", "2160p60") is None
+
+
+def test_quality_folder():
+    pytest.importorskip("manim")
+    assert quality_folder("l") == "480p15"
+    assert quality_folder("h") == "1080p60"
+
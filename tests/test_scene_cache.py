@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import tempconfig
+
+import scene_cache
+
+
+def test_cacheable_under_default_config():
+    assert scene_cache.cacheable()
+
+
+def test_partial_renders_are_not_cacheable():
+    with tempconfig({"from_animation_number": 2}):
+        assert not scene_cache.cacheable()
+    with tempconfig({"upto_animation_number": 5}):
+        assert not scene_cache.cacheable()
+
+
+class FakeWriter:
+    def __init__(self, movie_file_path):
+        self.movie_file_path = movie_file_path
+
+    def print_file_ready_message(self, file_path):
+        pass
+
+
+class FakeScene:
+    def __init__(self, movie_file_path):
+        self.renderer = type("FakeRenderer", (), {"file_writer": FakeWriter(movie_file_path)})()
+
+
+@pytest.fixture
+def installed(tmp_path, monkeypatch):
+    renders, opened = [], []
+
+    def render(scene, preview=False):
+        renders.append(scene)
+        movie = Path(scene.renderer.file_writer.movie_file_path)
+        movie.parent.mkdir(parents=True, exist_ok=True)
+        movie.write_bytes(b"movie")
+
+    monkeypatch.setattr(scene_cache, "_original_render", render)
+    monkeypatch.setattr(scene_cache, "cache", scene_cache.SceneCache(tmp_path / "cache"))
+    monkeypatch.setattr(scene_cache, "open_media_file", opened.append)
+    return renders, opened
+
+
+def test_hit_skips_render_and_still_previews(tmp_path, installed):
+    renders, opened = installed
+    movie = tmp_path / "media" / "FakeScene.mp4"
+    scene_cache._render(FakeScene(movie))
+    movie.unlink()
+    with tempconfig({"preview": True}):
+        scene = FakeScene(movie)
+        scene_cache._render(scene)
+    assert len(renders) == 1
+    assert movie.read_bytes() == b"movie"
+    assert opened == [scene.renderer.file_writer]
+
+
+def test_leftover_movie_is_not_cached(tmp_path, installed, monkeypatch):
+    monkeypatch.setattr(scene_cache, "_original_render", lambda scene, preview=False: None)
+    movie = tmp_path / "media" / "FakeScene.mp4"
+    movie.parent.mkdir()
+    movie.write_bytes(b"stale")
+    scene_cache._render(FakeScene(movie))
+    assert scene_cache.cache.entries() == []
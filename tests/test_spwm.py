@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+import spwm
+
+
+def fundamental(values):
+    """Amplitude of the first harmonic of each row, over one simulated period."""
+    return np.abs(np.fft.rfft(values, axis=-1)[..., 1]) / values.shape[-1] * 2
+
+
+@pytest.mark.parametrize("samples_per_carrier, tolerance", [(100, 5e-3), (2000, 5e-4)])
+def test_line_voltage_fundamental(samples_per_carrier, tolerance):
+    timeline = spwm.simulate(modulation_index=0.8, v_dc=400, samples_per_carrier=samples_per_carrier)
+    ideal = np.sqrt(3) / 2 * 0.8 * 400
+    assert fundamental(timeline.line_voltages) == pytest.approx(np.full(3, ideal), rel=tolerance)
+
+
+def test_switching_states():
+    timeline = spwm.simulate(carrier_frequency=2e3)
+    upper, lower = timeline.gates[0::2], timeline.gates[1::2]
+    # Exactly one IGBT of each leg conducts
+    assert np.all(upper ^ lower)
+    assert set(np.unique(timeline.line_voltages)) <= {-400, 0, 400}
+    assert np.allclose(timeline.line_voltages.sum(axis=0), 0)
+    assert np.allclose(timeline.phase_voltages.sum(axis=0), 0)
+    assert np.allclose(np.round(timeline.phase_voltages / (400 / 3)), timeline.phase_voltages / (400 / 3))
+    duty = timeline.decimate(timeline.gates, 50)
+    assert np.all((duty >= 0) & (duty <= 1))
+    assert np.allclose(duty[0::2] + duty[1::2], 1)
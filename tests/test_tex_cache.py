@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from manim import VMobject
+
+from tex_cache import TexCache
+
+
+def entry(n, seed=0):
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-8, 8, (n, 3)).astype(np.float32)
+    offsets = np.array([0, n // 2, n])
+    style = np.array([(1, 0, 1), (0.5, 2, 1)], dtype=np.float32)
+    return points, offsets, style
+
+
+def test_store_load_round_trip(tmp_path):
+    TexCache(tmp_path).store("a", *entry(40))
+    loaded = TexCache(tmp_path).load("a")
+    for stored, read in zip(entry(40), loaded):
+        assert np.array_equal(stored, read)
+    assert TexCache(tmp_path).load("missing") is None
+
+
+def test_put_get_keeps_float32_precision(tmp_path):
+    mob = VMobject()
+    points = np.random.default_rng(1).uniform(-8, 8, (12, 3))
+    mob.set_points(points)
+    mob.set_fill(opacity=0.75)
+    mob.set_stroke(width=3, opacity=0.5)
+    TexCache(tmp_path).put("glyph", [mob])
+
+    (copy,) = TexCache(tmp_path).get("glyph")
+    assert copy.points.dtype == float
+    assert np.allclose(copy.points, points, rtol=0, atol=1e-5)
+    assert copy.get_fill_opacity() == pytest.approx(0.75)
+    assert copy.get_stroke_width() == pytest.approx(3)
+    assert copy.get_stroke_opacity() == pytest.approx(0.5)
+
+
+def test_total_bytes_follows_the_directory(tmp_path):
+    cache = TexCache(tmp_path)
+    cache.store("a", *entry(40))
+    cache.store("b", *entry(80))
+    assert cache.total_bytes == cache.size()
+    cache.store("a", *entry(200))  # replacing an entry counts only the new size
+    assert cache.total_bytes == cache.size()
+    assert TexCache(tmp_path).total_bytes == cache.size()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = TexCache(tmp_path)
+    for i, key in enumerate("abc"):
+        cache.store(key, *entry(100, i))
+        os.utime(cache.path(key), (i, i))
+    size = cache.size()
+    cache.max_bytes = size  # the next entry goes over the cap
+    cache.store("d", *entry(100, 3))
+    assert not cache.path("a").exists()
+    assert cache.path("d").exists()
+    assert cache.total_bytes == cache.size() <= cache.max_bytes
@@ -0,0 +1,207 @@
+"""
+Typeset all of a scene's Tex strings with one LaTeX run before rendering it.
+
+Before a scene renders, its construct() is run once without LaTeX (every
+Tex/MathTex gets a placeholder outline, see dry_run.py) just to record the
+strings it builds. The strings that are not typeset yet go into a single
+multi-page document, which is compiled with one latex call and split back
+into one SVG per page with one dvisvgm call. The pages are stored under the
+names manim's own tex_to_svg_file looks for, so the real construct() finds
+every SVG already on disk. The SVG names are recorded per scene fingerprint
+(see scene_cache.py), so a later render of an unchanged scene whose SVGs
+are all still there skips the pre-pass altogether.
+
+Usage (at the top of a scene file):
+
+    import tex_batch
+    tex_batch.install()
+
+If the batch fails (a bad string, a template with a fixed body) the strings
+are simply compiled one by one as usual, which also gives manim's normal
+LaTeX error report. Templates with a document class other than manim's
+default are never batched: the batch document is an article, which only
+typesets like the default standalone class at the default font size.
+"""
+import json
+import os
+import re
+
+from manim import Scene, config, logger
+from manim.mobject.text import tex_mobject
+from manim.utils import tex_file_writing
+from manim.utils.tex import TexTemplate
+from manim.utils.tex_file_writing import tex_hash
+
+import tex_cache
+from dry_run import dry_run
+from scene_cache import scene_fingerprint
+from tex_cache import tex_code
+
+PLACEHOLDER_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10pt" height="10pt" viewBox="0 0 10 10">'
+    '<path d="M0 0H10V10H0Z"/></svg>'
+)
+BATCH_DOCUMENTCLASS = "\\documentclass{article}"
+# The only template class the article batch typesets the same way as
+DEFAULT_DOCUMENTCLASS = TexTemplate().documentclass
+PAGE_SETUP = "\\pagestyle{empty}\n\\setlength{\\parindent}{0pt}"
+
+_collecting = False
+_original_render = Scene.render
+
+
+def page_code(expression, environment, tex_template):
+    # The part of the document between \begin{document} and \end{document}
+    return tex_code(expression, environment, tex_template).split("\\begin{document}", 1)[1].rsplit("\\end{document}", 1)[0]
+
+
+def collect_tex(scene_class):
+    """(expression, environment, tex_template) for every Tex string scene_class builds,
+    and whether construct() ran to the end."""
+    global _collecting
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    placeholder = tex_dir / "batch_placeholder.svg"
+    placeholder.write_text(PLACEHOLDER_SVG)
+
+    found = {}
+
+    def record(expression, environment=None, tex_template=None):
+        tex_template = tex_template or config["tex_template"]
+        found.setdefault(tex_code(expression, environment, tex_template), (expression, environment, tex_template))
+        return placeholder
+
+    installed = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = record
+    _collecting = True
+    complete = True
+    try:
+        dry_run(scene_class)
+    except Exception as e:
+        complete = False
+        # Placeholders have the wrong shape for code that indexes into glyphs;
+        # whatever was recorded up to that point is still worth batching.
+        logger.debug(f"Tex pre-pass of {scene_class.__name__} stopped early: {e!r}")
+    finally:
+        _collecting = False
+        tex_mobject.tex_to_svg_file = installed
+    return list(found.values()), complete
+
+
+def compile_batch(entries, tex_template):
+    """Typeset entries (all sharing tex_template) in one document; returns how many were stored."""
+    if not tex_template.body.startswith(tex_template.documentclass):
+        # Templates read from a file have no separate preamble to reuse
+        return 0
+    if tex_template.documentclass != DEFAULT_DOCUMENTCLASS:
+        # Class options (font size, ...) would be lost in the article batch
+        return 0
+    tex_dir = config.get_dir("tex_dir")
+    codes = [tex_code(expression, environment, tex_template) for expression, environment, _ in entries]
+    pages = [page_code(expression, environment, tex_template) for expression, environment, _ in entries]
+
+    preamble = tex_template.body.split("\\begin{document}", 1)[0][len(tex_template.documentclass):]
+    document = "\n".join([
+        BATCH_DOCUMENTCLASS,
+        preamble,
+        PAGE_SETUP,
+        "\\begin{document}",
+        # \null makes sure every page is shipped out, even an empty one
+        "\n\\clearpage\n".join("\\null" + page for page in pages),
+        "\\end{document}",
+    ])
+    batch_name = "batch_" + tex_hash(document)
+    tex_file = tex_dir / (batch_name + ".tex")
+    tex_file.write_text(document, encoding="utf-8")
+
+    # Looked up on the module so an installed tex_format applies to batches too
+    command = tex_file_writing.tex_compilation_command(tex_template.tex_compiler, tex_template.output_format, tex_file, tex_dir)
+    if os.system(command) != 0:
+        logger.warning(f"Batched LaTeX run failed, falling back to one run per string (see {tex_file.with_suffix('.log')})")
+        return 0
+
+    dvi_file = tex_file.with_suffix(tex_template.output_format)
+    commands = [
+        "dvisvgm",
+        "--pdf" if tex_template.output_format == ".pdf" else "",
+        "--page=1-",
+        f'"{dvi_file.as_posix()}"',
+        "-n",
+        "-v 0",
+        f'-o "{(tex_dir / batch_name).as_posix()}-%p.svg"',
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+
+    page_files = {}
+    for path in tex_dir.glob(batch_name + "-*.svg"):
+        match = re.search(r"-(\d+)\.svg$", path.name)
+        if match:
+            page_files[int(match.group(1))] = path
+    if sorted(page_files) != list(range(1, len(codes) + 1)):
+        logger.warning(f"Batched LaTeX produced {len(page_files)} pages for {len(codes)} strings, falling back")
+        for path in page_files.values():
+            path.unlink()
+        return 0
+
+    for number, code in enumerate(codes, start=1):
+        os.replace(page_files[number], tex_dir / (tex_hash(code) + ".svg"))
+    if not config["no_latex_cleanup"]:
+        for path in tex_dir.glob(batch_name + ".*"):
+            path.unlink()
+    return len(codes)
+
+
+def is_typeset(svg_name, key):
+    if tex_cache.cache is not None and key in tex_cache.cache:
+        return True
+    return (config.get_dir("tex_dir") / svg_name).exists()
+
+
+def manifest_file(scene_class):
+    # (SVG name, tex_cache key) of every Tex string of the scene, by what the scene is made of
+    return config.get_dir("tex_dir") / "batches" / f"{scene_class.__name__}_{scene_fingerprint(scene_class)[:16]}.json"
+
+
+def precompile(scene_class):
+    """Typeset every not-yet-compiled Tex string of scene_class in one batch per template."""
+    manifest = manifest_file(scene_class)
+    try:
+        recorded = json.loads(manifest.read_text())
+    except (OSError, ValueError):
+        recorded = None
+    if recorded is not None and all(is_typeset(svg_name, key) for svg_name, key in recorded):
+        logger.debug(f"Every Tex string of {scene_class.__name__} is typeset, skipping the pre-pass")
+        return 0
+
+    entries, complete = collect_tex(scene_class)
+    pending = {}
+    names = []
+    for expression, environment, tex_template in entries:
+        svg_name = tex_hash(tex_code(expression, environment, tex_template)) + ".svg"
+        key = tex_cache.cache_key(expression, environment, tex_template)[0]
+        names.append((svg_name, key))
+        if not is_typeset(svg_name, key):
+            pending.setdefault(id(tex_template), []).append((expression, environment, tex_template))
+
+    compiled = 0
+    for entries in pending.values():
+        compiled += compile_batch(entries, entries[0][2])
+    if compiled:
+        logger.info(f"Typeset {compiled} Tex strings for {scene_class.__name__} in one batch")
+    if complete:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write_text(json.dumps(names))
+    return compiled
+
+
+def _render(self, *args, **kwargs):
+    if not _collecting:
+        precompile(type(self))
+    return _original_render(self, *args, **kwargs)
+
+
+def install():
+    """Batch-compile each scene's Tex strings right before it renders."""
+    Scene.render = _render
@@ -0,0 +1,211 @@
+"""
+Persistent on-disk cache for typeset Tex/MathTex glyph outlines.
+
+manim only remembers compiled LaTeX inside one media directory and re-parses
+the SVG in every process. This cache stores the parsed path data of each
+SingleStringMathTex as a small .npz file, keyed by the full LaTeX document
+(expression, environment and template) - font size and colour are applied
+afterwards by manim, so one entry serves every size and colour. The cache
+directory is shared between processes and runs, and is kept under a size cap
+by evicting the least recently used entries.
+
+Usage (at the top of a scene file):
+
+    import tex_cache
+    tex_cache.install()
+
+The location defaults to ~/.cache/manim_tex and can be moved with the
+MANIM_TEX_CACHE environment variable.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from manim import config, VMobject
+from manim.mobject.text import tex_mobject
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils.tex_file_writing import tex_hash
+
+CACHE_VERSION = "1"
+DEFAULT_CACHE_DIR = Path(os.environ.get("MANIM_TEX_CACHE", Path.home() / ".cache" / "manim_tex"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def tex_code(expression, environment, tex_template):
+    # Same document manim's generate_tex_file would write
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def cache_key(expression, environment=None, tex_template=None):
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    code = tex_code(expression, environment, tex_template)
+    seed = "\0".join([CACHE_VERSION, tex_template.tex_compiler, tex_template.output_format, code])
+    return hashlib.sha256(seed.encode()).hexdigest(), code
+
+
+def build_submobjects(entry):
+    points, offsets, style = entry
+    submobjects = []
+    for i, (fill_opacity, stroke_width, stroke_opacity) in enumerate(style):
+        mob = VMobject()
+        mob.set_points(points[offsets[i]:offsets[i + 1]].astype(float))
+        mob.set_fill(opacity=float(fill_opacity))
+        mob.set_stroke(width=float(stroke_width), opacity=float(stroke_opacity))
+        submobjects.append(mob)
+    return submobjects
+
+
+class TexCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        # Running size of the directory, so a put only rescans it once it is over the cap
+        self.total_bytes = self.size()
+        # Arrays already read by this process, so repeated glyphs skip the disk
+        self.loaded = {}
+
+    def path(self, key):
+        return self.cache_dir / f"{key}.npz"
+
+    def __contains__(self, key):
+        return key in self.loaded or self.path(key).exists()
+
+    def load(self, key):
+        """(points, offsets, style) arrays stored under key, or None on a miss."""
+        entry = self.loaded.get(key)
+        if entry is None:
+            path = self.path(key)
+            try:
+                with np.load(path, allow_pickle=False) as data:
+                    entry = (data["points"], data["offsets"], data["style"])
+                os.utime(path)  # mark as recently used for LRU eviction
+            except (OSError, ValueError, KeyError):
+                return None
+            self.loaded[key] = entry
+        return entry
+
+    def store(self, key, points, offsets, style):
+        self.loaded[key] = (points, offsets, style)
+        # Write to a temporary file first so concurrent renders never read half an entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, points=points, offsets=offsets, style=style)
+        path = self.path(key)
+        try:
+            self.total_bytes -= path.stat().st_size
+        except OSError:
+            pass
+        os.replace(tmp_name, path)
+        self.total_bytes += os.path.getsize(path)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def get(self, key):
+        """Fresh submobjects for key, or None on a miss."""
+        entry = self.load(key)
+        return None if entry is None else build_submobjects(entry)
+
+    def put(self, key, submobjects):
+        points = [mob.points for mob in submobjects]
+        offsets = np.cumsum([0] + [len(p) for p in points])
+        style = np.array([
+            (mob.get_fill_opacity(), mob.get_stroke_width(), mob.get_stroke_opacity())
+            for mob in submobjects
+        ], dtype=np.float32).reshape(-1, 3)
+        points = np.concatenate(points).astype(np.float32) if points else np.zeros((0, 3), np.float32)
+        self.store(key, points, offsets, style)
+
+    def entries(self):
+        return [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".npz")]
+
+    def size(self):
+        return sum(entry.stat().st_size for entry in self.entries())
+
+    def evict(self):
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self.entries()]
+        # Other processes may have added or evicted entries since the running total was taken
+        total = self.total_bytes = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        # Drop the least recently used entries until we are comfortably under the cap
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= 0.9 * self.max_bytes:
+                break
+        self.total_bytes = total
+
+    def clear(self):
+        for entry in self.entries():
+            os.remove(entry.path)
+        self.loaded.clear()
+        self.total_bytes = 0
+
+
+cache = None
+# SVG path -> (cache key, the entry loaded for it, or None if it has to be typeset)
+_entries_by_svg = {}
+_original_tex_to_svg_file = tex_mobject.tex_to_svg_file
+_original_init_svg_mobject = SingleStringMathTex.init_svg_mobject
+
+
+def _cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    key, code = cache_key(expression, environment, tex_template)
+    # Loaded now, so an entry evicted before init_svg_mobject runs is still there to use
+    entry = cache.load(key)
+    if entry is not None:
+        # No LaTeX run: the path is only used as an identifier from here on
+        svg_file = config.get_dir("tex_dir") / (tex_hash(code) + ".svg")
+    else:
+        svg_file = _original_tex_to_svg_file(expression, environment, tex_template)
+    _entries_by_svg[str(svg_file)] = (key, entry)
+    return svg_file
+
+
+def _cached_init_svg_mobject(self, use_svg_cache):
+    found = _entries_by_svg.get(str(self.file_name))
+    if found is None:
+        return _original_init_svg_mobject(self, use_svg_cache)
+    key, entry = found
+    if entry is None:
+        _original_init_svg_mobject(self, use_svg_cache)
+        cache.put(key, self.submobjects)
+    else:
+        self.add(*build_submobjects(entry))
+
+
+def install(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """Route every Tex/MathTex built in this process through the disk cache."""
+    global cache
+    cache = TexCache(cache_dir, max_bytes)
+    tex_mobject.tex_to_svg_file = _cached_tex_to_svg_file
+    SingleStringMathTex.init_svg_mobject = _cached_init_svg_mobject
+    return cache
+
+
+def uninstall():
+    tex_mobject.tex_to_svg_file = _original_tex_to_svg_file
+    SingleStringMathTex.init_svg_mobject = _original_init_svg_mobject
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the Tex outline cache.")
+    parser.add_argument("--clear", action="store_true")
+    args = parser.parse_args()
+
+    tex = TexCache()
+    if args.clear:
+        tex.clear()
+    print(f"{tex.cache_dir}: {len(tex.entries())} entries, {tex.total_bytes / 1024 / 1024:.1f} MB (cap {tex.max_bytes / 1024 / 1024:.0f} MB)")
@@ -0,0 +1,105 @@
+"""
+Precompiled LaTeX formats for Tex-heavy scenes.
+
+Most of a short Tex compile is spent loading the same preamble (babel,
+amsmath, amssymb, fonts). With this installed, the preamble of each .tex
+file manim compiles is dumped once into a .fmt format file (using the
+mylatexformat package that ships with TeX Live and MiKTeX) and every later
+compile loads that format instead of reading the preamble again.
+
+Formats are named after a hash of the compiler and the preamble text, so
+changing the tex template simply produces (and builds) a new format.
+
+Usage (at the top of a scene file):
+
+    import tex_format
+    tex_format.install()
+
+Only latex and pdflatex are supported; other compilers, and any preamble
+whose format fails to build, fall back to the normal compile command.
+"""
+import os
+from pathlib import Path
+
+from manim import logger
+from manim.utils import tex_file_writing
+from manim.utils.tex_file_writing import tex_hash
+
+SUPPORTED_COMPILERS = {"latex", "pdflatex"}
+
+_original_tex_compilation_command = tex_file_writing.tex_compilation_command
+_failed = set()
+
+
+def preamble_of(tex_file):
+    text = Path(tex_file).read_text(encoding="utf-8")
+    if "\\begin{document}" not in text:
+        return None
+    return text.split("\\begin{document}", 1)[0]
+
+
+def build_format(tex_compiler, preamble, fmt_file):
+    fmt_dir = fmt_file.parent
+    fmt_dir.mkdir(parents=True, exist_ok=True)
+    source = fmt_file.with_suffix(".tex")
+    source.write_text(preamble + "\\begin{document}\n\\end{document}\n", encoding="utf-8")
+    # Build under a per-process job name so parallel renders never see half a format
+    jobname = f"{fmt_file.stem}_{os.getpid()}"
+    command = [
+        tex_compiler,
+        "-ini",
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-jobname={jobname}",
+        f'-output-directory="{fmt_dir.as_posix()}"',
+        f'"&{tex_compiler}"',
+        "mylatexformat.ltx",
+        f'"{source.as_posix()}"',
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(command))
+    built = fmt_dir / (jobname + ".fmt")
+    if not built.exists():
+        return False
+    os.replace(built, fmt_file)
+    logger.info(f"Built LaTeX format {fmt_file}")
+    return True
+
+
+def format_file(tex_compiler, tex_file, tex_dir):
+    """The .fmt for tex_file's preamble, building it on first use; None if unavailable."""
+    preamble = preamble_of(tex_file)
+    if preamble is None:
+        return None
+    fmt_file = Path(tex_dir) / "formats" / f"{tex_compiler}_{tex_hash(tex_compiler + preamble)}.fmt"
+    if fmt_file.exists():
+        return fmt_file
+    if fmt_file in _failed:
+        return None
+    if not build_format(tex_compiler, preamble, fmt_file):
+        logger.warning(f"Could not build a LaTeX format for {tex_file}, compiling without one")
+        _failed.add(fmt_file)
+        return None
+    return fmt_file
+
+
+def _tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir):
+    command = _original_tex_compilation_command(tex_compiler, output_format, tex_file, tex_dir)
+    if tex_compiler not in SUPPORTED_COMPILERS:
+        return command
+    fmt_file = format_file(tex_compiler, tex_file, tex_dir)
+    if fmt_file is None:
+        return command
+    # The format skips the document's own preamble up to \begin{document}
+    fmt_flag = f'-fmt="{fmt_file.with_suffix("").as_posix()}"'
+    return f"{tex_compiler} {fmt_flag} {command[len(tex_compiler) + 1:]}"
+
+
+def install():
+    """Compile every Tex against a precompiled format of its preamble."""
+    tex_file_writing.tex_compilation_command = _tex_compilation_command
+
+
+def uninstall():
+    tex_file_writing.tex_compilation_command = _original_tex_compilation_command
@@ -1,7 +1,9 @@
 from manim import *
 import numpy as np
 
-class EVCharacteristicsEnhanced(Scene):
+from fast_render import FastScene
+
+class EVCharacteristicsEnhanced(FastScene):
     def construct(self):
         # Title sequence with animated motor
         title = Text("Electric Vehicle Motor Characteristics", font_size=40)
@@ -78,7 +80,7 @@ class EVCharacteristicsEnhanced(Scene):
         def torque_func(x):
             return 8 * np.exp(-0.2 * x)
         
-        curve = axes.plot(torque_func, color=BLUE)
+        curve = axes.plot(torque_func, color=BLUE, use_vectorized=True)
         dot = Dot(color=YELLOW)
         dot.move_to(axes.c2p(0, torque_func(0)))
         